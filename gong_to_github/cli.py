@@ -1,6 +1,7 @@
 """CLI for Gong to GitHub sync."""
 
 from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -10,15 +11,29 @@ from dotenv import load_dotenv
 from .gong_client import GongClient
 from .github_sync import GitHubSync, LocalSync
 from .markdown_converter import (
-    call_to_markdown,
+    client_index_entry,
     generate_client_folder_name,
     generate_client_index,
-    generate_filename,
+    parse_client_index_rows,
+    render_call,
 )
-from .state import SyncState, load_state, save_state, update_last_sync
+from .models import ClientIndexEntry
+from .state import SyncState, load_state, mark_seen, save_state, update_last_sync
 
 load_dotenv()
 
+# Transcript files are independent, so local writes are overlapped on a thread pool
+LOCAL_WRITE_WORKERS = 16
+
+
+def _existing_index_rows(sync: GitHubSync | LocalSync, client_folder: str) -> dict[str, str]:
+    """Return the rows of a client's current index whose transcript still exists."""
+    index = sync.read_client_index(client_folder)
+    if not index:
+        return {}
+    existing = set(sync.list_existing_transcripts(client_folder))
+    return {name: row for name, row in parse_client_index_rows(index).items() if name in existing}
+
 
 @click.group()
 @click.option(
@@ -43,7 +58,9 @@ load_dotenv()
 def cli(ctx: click.Context, gong_access_key: str, gong_secret_key: str, gong_api_url: str | None) -> None:
     """Sync Gong call transcripts to GitHub as Markdown files."""
     ctx.ensure_object(dict)
-    ctx.obj["gong_client"] = GongClient(gong_access_key, gong_secret_key, gong_api_url)
+    gong_client = GongClient(gong_access_key, gong_secret_key, gong_api_url)
+    ctx.call_on_close(gong_client.close)
+    ctx.obj["gong_client"] = gong_client
 
 
 @cli.command()
@@ -101,52 +118,77 @@ def sync_local(
         from_date = state.last_sync_timestamp
         click.echo(f"Resuming from last sync: {from_date}")
 
-    click.echo("Fetching calls from Gong...")
-
-    # Group calls by client
-    calls_by_client: dict[str, list] = defaultdict(list)
-    call_count = 0
-
-    with click.progressbar(
-        gong_client.get_full_calls(from_date=from_date, to_date=to_date),
-        label="Processing calls",
-    ) as calls:
-        for call in calls:
-            call_count += 1
-            client_folder = generate_client_folder_name(call)
-            calls_by_client[client_folder].append(call)
+    # Don't fetch transcripts for calls that were synced before or are already on disk
+    skip_ids = None
+    if not update_existing and not full_sync:
+        skip_ids = (state.seen_ids | local_sync.synced_call_ids()).__contains__
 
-    click.echo(f"\nFound {call_count} calls for {len(calls_by_client)} clients")
+    click.echo("Fetching calls from Gong...")
 
-    # Sync calls
+    # Write each transcript as soon as it is fetched and keep only a
+    # lightweight index entry per call, not the full transcript
+    results: dict[str, list[tuple[str, Future[bool] | None]]] = defaultdict(list)
+    index_entries: dict[str, list[ClientIndexEntry]] = defaultdict(list)
+    call_ids: list[str] = []
+    # Pending write per (client folder, filename); two calls can render to the same file
+    writes: dict[tuple[str, str], Future[bool]] = {}
+
+    with ThreadPoolExecutor(max_workers=LOCAL_WRITE_WORKERS) as executor:
+        with click.progressbar(
+            gong_client.get_full_calls(from_date=from_date, to_date=to_date, skip_ids=skip_ids),
+            label="Processing calls",
+        ) as calls:
+            for call in calls:
+                filename, content = render_call(call)
+                client_folder = generate_client_folder_name(call)
+                earlier = writes.get((client_folder, filename))
+                if earlier is not None and not update_existing:
+                    # The first call wins, as it would when writing one file at a time
+                    future = None
+                else:
+                    if earlier is not None:
+                        # Land writes to the same path in order, so the last call wins
+                        earlier.result()
+                    future = executor.submit(
+                        local_sync.sync_transcript,
+                        client_folder=client_folder,
+                        filename=filename,
+                        content=content,
+                        update_existing=update_existing,
+                    )
+                    writes[client_folder, filename] = future
+                results[client_folder].append((filename, future))
+                index_entries[client_folder].append(client_index_entry(call))
+                call_ids.append(call.metadata.id)
+
+    call_count = sum(len(entries) for entries in index_entries.values())
+    click.echo(f"\nFound {call_count} calls for {len(index_entries)} clients")
+
+    # Report results
     synced_count = 0
     skipped_count = 0
-    for client_folder, client_calls in calls_by_client.items():
-        click.echo(f"\n[{client_folder}] Syncing {len(client_calls)} calls...")
-
-        for call in client_calls:
-            filename = generate_filename(call)
-            content = call_to_markdown(call)
-
-            if local_sync.sync_transcript(
-                client_folder=client_folder,
-                filename=filename,
-                content=content,
-                update_existing=update_existing,
-            ):
+    for client_folder, client_results in results.items():
+        click.echo(f"\n[{client_folder}] Syncing {len(client_results)} calls...")
+
+        for filename, future in client_results:
+            if future is not None and future.result():
                 synced_count += 1
                 click.echo(f"  + {filename}")
             else:
                 skipped_count += 1
                 click.echo(f"  = {filename} (exists)")
 
-        # Generate client index
+        # Generate client index, keeping calls synced by earlier runs listed
         client_name = client_folder.replace("-", " ").title()
-        index_content = generate_client_index(client_name, client_calls)
+        index_content = generate_client_index(
+            client_name,
+            index_entries[client_folder],
+            _existing_index_rows(local_sync, client_folder),
+        )
         local_sync.sync_client_index(client_folder, index_content)
 
     # Update state
-    update_last_sync(state)
+    state = mark_seen(update_last_sync(state), call_ids)
     save_state(state, state_file)
 
     click.echo(f"\nSynced {synced_count} new, {skipped_count} already existed → {output_dir}")
@@ -221,6 +263,7 @@ def sync_github(
         click.echo("[DRY RUN] No changes will be pushed to GitHub")
 
     github_sync = GitHubSync(github_token, repo, branch)
+    ctx.call_on_close(github_sync.close)
 
     # Load state
     state = SyncState() if full_sync else load_state(state_file)
@@ -230,58 +273,71 @@ def sync_github(
         from_date = state.last_sync_timestamp
         click.echo(f"Resuming from last sync: {from_date}")
 
+    # Don't fetch transcripts for calls that were synced before
+    skip_ids = None if update_existing or full_sync else state.seen_ids.__contains__
+
     click.echo("Fetching calls from Gong...")
 
-    # Group calls by client
-    calls_by_client: dict[str, list] = defaultdict(list)
+    # Stage each transcript as soon as it is fetched and keep only a
+    # lightweight index entry per call, not the full transcript
+    results: dict[str, list[tuple[str, bool]]] = defaultdict(list)
+    index_entries: dict[str, list[ClientIndexEntry]] = defaultdict(list)
+    call_ids: list[str] = []
     call_count = 0
 
-    for call in gong_client.get_full_calls(from_date=from_date, to_date=to_date):
+    calls = gong_client.get_full_calls(from_date=from_date, to_date=to_date, skip_ids=skip_ids)
+    for call in calls:
+        filename, content = render_call(call)
         call_count += 1
         client_folder = generate_client_folder_name(call)
-        calls_by_client[client_folder].append(call)
+
+        staged = dry_run or github_sync.stage_transcript(
+            client_folder=client_folder,
+            filename=filename,
+            content=content,
+            update_existing=update_existing,
+        )
+        results[client_folder].append((filename, staged))
+        index_entries[client_folder].append(client_index_entry(call))
+        call_ids.append(call.metadata.id)
 
         if call_count % 10 == 0:
             click.echo(f"  Fetched {call_count} calls...")
 
-    click.echo(f"\nFound {call_count} calls for {len(calls_by_client)} clients")
+    click.echo(f"\nFound {call_count} calls for {len(index_entries)} clients")
 
-    # Sync calls
+    # Report results, then push everything as a single commit
     synced_count = 0
     skipped_count = 0
-    for client_folder, client_calls in calls_by_client.items():
-        click.echo(f"\n[{client_folder}] Syncing {len(client_calls)} calls...")
-
-        for call in client_calls:
-            filename = generate_filename(call)
-            content = call_to_markdown(call)
+    for client_folder, client_results in results.items():
+        click.echo(f"\n[{client_folder}] Syncing {len(client_results)} calls...")
 
+        for filename, staged in client_results:
             if dry_run:
                 click.echo(f"  [DRY] Would sync: {filename}")
                 synced_count += 1
-                continue
-
-            if github_sync.sync_transcript(
-                client_folder=client_folder,
-                filename=filename,
-                content=content,
-                update_existing=update_existing,
-            ):
+            elif staged:
                 synced_count += 1
                 click.echo(f"  + {filename}")
             else:
                 skipped_count += 1
                 click.echo(f"  = {filename} (exists)")
 
-        # Generate client index
+        # Generate client index, keeping calls synced by earlier runs listed
         if not dry_run:
             client_name = client_folder.replace("-", " ").title()
-            index_content = generate_client_index(client_name, client_calls)
-            github_sync.sync_client_index(client_folder, index_content)
+            index_content = generate_client_index(
+                client_name,
+                index_entries[client_folder],
+                _existing_index_rows(github_sync, client_folder),
+            )
+            github_sync.stage_client_index(client_folder, index_content)
 
-    # Update state
     if not dry_run:
-        update_last_sync(state)
+        github_sync.commit_staged(f"Sync {synced_count} transcript(s) from Gong")
+
+        # Update state
+        state = mark_seen(update_last_sync(state), call_ids)
         save_state(state, state_file)
 
     click.echo(f"\nSynced {synced_count} new, {skipped_count} already existed → {repo}")
@@ -314,15 +370,16 @@ def list_calls(
 
     click.echo("Fetching calls from Gong...")
 
-    calls_by_client: dict[str, list] = defaultdict(list)
+    # Only (started, title) is kept per call, not the full transcript
+    calls_by_client: dict[str, list[tuple[datetime | None, str | None]]] = defaultdict(list)
     client_filter = client.lower() if client else None
 
     for call in gong_client.get_full_calls(from_date=from_date, to_date=to_date):
         client_folder = generate_client_folder_name(call)
-        # Apply client filter if specified
-        if client_filter and client_filter not in client_folder.lower():
+        # Apply client filter if specified (folder names are already lowercase slugs)
+        if client_filter and client_filter not in client_folder:
             continue
-        calls_by_client[client_folder].append(call)
+        calls_by_client[client_folder].append((call.metadata.started, call.metadata.title))
 
     click.echo(f"\nFound {sum(len(c) for c in calls_by_client.values())} external calls\n")
 
@@ -330,13 +387,12 @@ def list_calls(
         client_calls = calls_by_client[client_folder]
         click.echo(f"[{client_folder}] {len(client_calls)} calls")
 
-        for call in sorted(client_calls, key=lambda c: c.metadata.started or datetime.min):
+        for started, title in sorted(client_calls, key=lambda c: c[0] or datetime.min):
             date_str = "N/A"
-            if call.metadata.started:
-                date_str = call.metadata.started.strftime("%Y-%m-%d")
+            if started:
+                date_str = started.strftime("%Y-%m-%d")
 
-            title = call.metadata.title or "Untitled"
-            click.echo(f"  - {date_str}: {title}")
+            click.echo(f"  - {date_str}: {title or 'Untitled'}")
 
 
 @cli.command()
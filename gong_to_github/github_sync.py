@@ -1,13 +1,20 @@
 """GitHub sync module for pushing transcripts."""
 
+import os
+import threading
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
-from github import Auth, Github, GithubException
+from github import Auth, Github, GithubException, InputGitTreeElement
 
 
 class GitHubSync:
     """Sync markdown files to a GitHub repository."""
 
+    # Concurrent blob uploads when committing a batch
+    UPLOAD_WORKERS = 8
+
     def __init__(self, token: str, repo_name: str, branch: str = "main"):
         """
         Initialize GitHub sync.
@@ -21,19 +28,47 @@ class GitHubSync:
         self.github = Github(auth=auth)
         self.repo = self.github.get_repo(repo_name)
         self.branch = branch
-
-    def file_exists(self, path: str) -> bool:
-        """Check if a file exists in the repository."""
-        try:
-            self.repo.get_contents(path, ref=self.branch)
-            return True
-        except GithubException as e:
-            if e.status == 404:
-                return False
-            raise
-
-    def get_file_sha(self, path: str) -> str | None:
-        """Get the SHA of an existing file."""
+        # path -> blob SHA for every file on the branch, loaded lazily
+        self._tree_cache: dict[str, str] | None = None
+        self._tree_truncated = False
+        # Staged path -> pending blob upload; content is uploaded as soon as it
+        # is staged so it doesn't have to be held until the commit
+        self._staged: dict[str, Future[str]] = {}
+        self._uploads = ThreadPoolExecutor(max_workers=self.UPLOAD_WORKERS)
+        # Serializes the first commit of an empty repository across uploads
+        self._init_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Wait for pending blob uploads and shut down the upload pool."""
+        self._uploads.shutdown()
+
+    def __enter__(self) -> "GitHubSync":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _load_tree(self) -> dict[str, str]:
+        """Load the SHA of every file on the branch with one recursive tree fetch."""
+        if self._tree_cache is None:
+            try:
+                tree = self.repo.get_git_tree(self.branch, recursive=True)
+            except GithubException as e:
+                # Missing branch or empty repository: nothing exists yet
+                if e.status not in (404, 409):
+                    raise
+                self._tree_cache = {}
+            else:
+                self._tree_cache = {
+                    item.path: item.sha for item in tree.tree if item.type == "blob"
+                }
+                # Very large trees are truncated by the API; fall back to
+                # per-path lookups for anything not in the partial listing
+                self._tree_truncated = bool(tree.raw_data.get("truncated"))
+        return self._tree_cache
+
+    def _fetch_file_sha(self, path: str) -> str | None:
+        """Fetch the SHA of an existing file from the contents API."""
         try:
             contents = self.repo.get_contents(path, ref=self.branch)
             if isinstance(contents, list):
@@ -44,6 +79,26 @@ class GitHubSync:
                 return None
             raise
 
+    def file_exists(self, path: str) -> bool:
+        """Check if a file exists in the repository."""
+        return self.get_file_sha(path) is not None
+
+    def get_file_sha(self, path: str) -> str | None:
+        """Get the SHA of an existing file."""
+        tree = self._load_tree()
+        if path in tree:
+            return tree[path]
+        if self._tree_truncated:
+            sha = self._fetch_file_sha(path)
+            if sha:
+                tree[path] = sha
+            return sha
+        return None
+
+    def transcript_path(self, client_folder: str, filename: str) -> str:
+        """Get the repository path of a transcript file."""
+        return f"transcripts/{client_folder}/{filename}"
+
     def create_or_update_file(
         self,
         path: str,
@@ -70,7 +125,7 @@ class GitHubSync:
 
         try:
             if existing_sha:
-                self.repo.update_file(
+                result = self.repo.update_file(
                     path=path,
                     message=commit_message,
                     content=content,
@@ -78,12 +133,13 @@ class GitHubSync:
                     branch=self.branch,
                 )
             else:
-                self.repo.create_file(
+                result = self.repo.create_file(
                     path=path,
                     message=commit_message,
                     content=content,
                     branch=self.branch,
                 )
+            self._load_tree()[path] = result["content"].sha
             return True
         except GithubException as e:
             raise RuntimeError(f"Failed to create/update file {path}: {e}")
@@ -107,7 +163,7 @@ class GitHubSync:
         Returns:
             True if file was synced, False if skipped
         """
-        path = f"transcripts/{client_folder}/{filename}"
+        path = self.transcript_path(client_folder, filename)
         commit_message = f"Add transcript: {client_folder}/{filename}"
 
         return self.create_or_update_file(
@@ -142,21 +198,151 @@ class GitHubSync:
             update_existing=True,  # Always update index
         )
 
-    def list_existing_transcripts(self, client_folder: str) -> list[str]:
-        """List existing transcript files for a client."""
-        path = f"transcripts/{client_folder}"
+    def read_client_index(self, client_folder: str) -> str | None:
+        """Read a client's index file from the branch, or None if it has none yet."""
+        path = f"transcripts/{client_folder}/README.md"
+        if not self.get_file_sha(path):
+            return None
+        contents = self.repo.get_contents(path, ref=self.branch)
+        if isinstance(contents, list):
+            return None
+        return contents.decoded_content.decode("utf-8")
+
+    def stage_transcript(
+        self,
+        client_folder: str,
+        filename: str,
+        content: str,
+        update_existing: bool = False,
+    ) -> bool:
+        """
+        Stage a transcript file for the next batch commit.
+
+        Args:
+            client_folder: Client folder name (e.g., "acme-corp")
+            filename: Markdown filename (e.g., "2025-01-04-discovery-call.md")
+            content: Markdown content
+            update_existing: Whether to update if file exists
+
+        Returns:
+            True if file was staged, False if skipped
+        """
+        path = self.transcript_path(client_folder, filename)
+        # A path staged earlier in this batch counts as existing, so the
+        # first of two calls rendering to the same filename wins
+        if not update_existing and (path in self._staged or self.get_file_sha(path)):
+            return False
+
+        self._stage(path, content)
+        return True
+
+    def stage_client_index(self, client_folder: str, content: str) -> None:
+        """Stage a client's index file for the next batch commit."""
+        self._stage(f"transcripts/{client_folder}/README.md", content)
+
+    def _stage(self, path: str, content: str) -> None:
+        """Start uploading a file's blob and stage it for the next commit."""
+        self._staged[path] = self._uploads.submit(self._upload_blob, path, content)
+
+    def _upload_blob(self, path: str, content: str) -> str:
+        """
+        Upload a file's blob and return its SHA.
+
+        The Git Data API rejects every call on a repository without commits,
+        so the first upload to an empty repository commits its file through
+        the contents API instead, which creates the branch.
+        """
         try:
-            contents = self.repo.get_contents(path, ref=self.branch)
-            if isinstance(contents, list):
-                return [
-                    c.name for c in contents
-                    if c.name.endswith(".md") and c.name != "README.md"
-                ]
-            return []
+            return self.repo.create_git_blob(content, "utf-8").sha
         except GithubException as e:
-            if e.status == 404:
+            if e.status != 409:
+                raise
+
+        with self._init_lock:
+            try:
+                return self.repo.create_git_blob(content, "utf-8").sha
+            except GithubException as e:
+                if e.status != 409:
+                    raise
+            result = self.repo.create_file(
+                path=path,
+                message=f"Add {path}",
+                content=content,
+                branch=self.branch,
+            )
+            return result["content"].sha
+
+    def commit_staged(self, commit_message: str) -> int:
+        """
+        Commit all staged files to the branch as a single commit.
+
+        Uses the Git Data API (the blobs uploaded while staging, one tree,
+        one commit, one ref update) instead of one contents API commit per file.
+
+        Args:
+            commit_message: Commit message
+
+        Returns:
+            Number of files committed
+        """
+        if not self._staged:
+            return 0
+
+        staged = list(self._staged.items())
+
+        try:
+            files = [(path, upload.result()) for path, upload in staged]
+
+            elements = [
+                InputGitTreeElement(path, "100644", "blob", sha=sha) for path, sha in files
+            ]
+
+            try:
+                ref = self.repo.get_git_ref(f"heads/{self.branch}")
+            except GithubException as e:
+                # Missing branch or empty repository: start it with a root commit
+                if e.status not in (404, 409):
+                    raise
+                tree = self.repo.create_git_tree(elements)
+                commit = self.repo.create_git_commit(commit_message, tree, [])
+                self.repo.create_git_ref(f"refs/heads/{self.branch}", commit.sha)
+            else:
+                parent = self.repo.get_git_commit(ref.object.sha)
+                tree = self.repo.create_git_tree(elements, base_tree=parent.tree)
+                commit = self.repo.create_git_commit(commit_message, tree, [parent])
+                ref.edit(commit.sha)
+        except GithubException as e:
+            raise RuntimeError(f"Failed to commit {len(staged)} files: {e}")
+
+        self._load_tree().update(files)
+        self._staged.clear()
+
+        return len(files)
+
+    def list_existing_transcripts(self, client_folder: str) -> list[str]:
+        """List existing transcript files for a client."""
+        prefix = f"transcripts/{client_folder}/"
+        tree = self._load_tree()
+
+        if self._tree_truncated:
+            try:
+                contents = self.repo.get_contents(prefix.rstrip("/"), ref=self.branch)
+            except GithubException as e:
+                if e.status == 404:
+                    return []
+                raise
+            if not isinstance(contents, list):
                 return []
-            raise
+            return [
+                c.name for c in contents
+                if c.name.endswith(".md") and c.name != "README.md"
+            ]
+
+        names = (path[len(prefix):] for path in tree if path.startswith(prefix))
+        return [
+            name for name in names
+            if "/" not in name and name.endswith(".md") and name != "README.md"
+        ]
 
 
 class LocalSync:
@@ -171,6 +357,40 @@ class LocalSync:
         """
         self.output_dir = output_dir
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._client_dirs: dict[str, Path] = {}
+
+    def _client_dir(self, client_folder: str) -> Path:
+        """Return a client's folder, building and creating it only for its first file."""
+        folder = self._client_dirs.get(client_folder)
+        if folder is None:
+            folder = self.output_dir / "transcripts" / client_folder
+            folder.mkdir(parents=True, exist_ok=True)
+            self._client_dirs[client_folder] = folder
+        return folder
+
+    @staticmethod
+    def _write_file(file_path: Path, content: str) -> bool:
+        """
+        Atomically write a file unless it already has the same content.
+
+        The content goes to a temporary file that is then renamed over the
+        target, so an interrupted sync never leaves a truncated file behind.
+
+        Returns:
+            True if the file was written, False if it was already up to date
+        """
+        data = content.encode("utf-8")
+
+        try:
+            if file_path.read_bytes() == data:
+                return False
+        except FileNotFoundError:
+            pass
+
+        tmp_path = file_path.with_name(f".{file_path.name}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, file_path)
+        return True
 
     def sync_transcript(
         self,
@@ -180,16 +400,36 @@ class LocalSync:
         update_existing: bool = False,
     ) -> bool:
         """Sync a transcript file locally."""
-        folder = self.output_dir / "transcripts" / client_folder
-        folder.mkdir(parents=True, exist_ok=True)
+        return self.sync_transcripts_batch(client_folder, [(filename, content)], update_existing)[0]
 
-        file_path = folder / filename
+    def sync_transcripts_batch(
+        self,
+        client_folder: str,
+        files: Iterable[tuple[str, str]],
+        update_existing: bool = False,
+    ) -> list[bool]:
+        """
+        Sync several transcripts of one client, resolving its folder once.
 
-        if file_path.exists() and not update_existing:
-            return False
+        Args:
+            client_folder: Client folder name
+            files: (filename, content) pairs
+            update_existing: Whether to overwrite existing files
 
-        file_path.write_text(content)
-        return True
+        Returns:
+            For each file, True if it was written, False if skipped
+        """
+        folder = self._client_dir(client_folder)
+        results = []
+
+        for filename, content in files:
+            file_path = folder / filename
+            if not update_existing and file_path.is_file():
+                results.append(False)
+            else:
+                results.append(self._write_file(file_path, content))
+
+        return results
 
     def sync_client_index(
         self,
@@ -197,13 +437,18 @@ class LocalSync:
         content: str,
     ) -> bool:
         """Sync a client's index file locally."""
-        folder = self.output_dir / "transcripts" / client_folder
-        folder.mkdir(parents=True, exist_ok=True)
-
-        file_path = folder / "README.md"
-        file_path.write_text(content)
+        self._write_file(self._client_dir(client_folder) / "README.md", content)
         return True
 
+    def read_client_index(self, client_folder: str) -> str | None:
+        """Read a client's index file, or None if it has none yet."""
+        try:
+            return (self.output_dir / "transcripts" / client_folder / "README.md").read_text(
+                encoding="utf-8"
+            )
+        except FileNotFoundError:
+            return None
+
     def list_existing_transcripts(self, client_folder: str) -> list[str]:
         """List existing transcript files for a client."""
         folder = self.output_dir / "transcripts" / client_folder
@@ -214,3 +459,23 @@ class LocalSync:
             f.name for f in folder.iterdir()
             if f.suffix == ".md" and f.name != "README.md"
         ]
+
+    def synced_call_ids(self) -> set[str]:
+        """Collect the Gong call IDs of all transcripts already written."""
+        call_ids: set[str] = set()
+        transcripts_dir = self.output_dir / "transcripts"
+        if not transcripts_dir.is_dir():
+            return call_ids
+
+        # gong_id is always the first frontmatter field, so only two lines are read
+        for file_path in transcripts_dir.glob("*/*.md"):
+            if file_path.name == "README.md":
+                continue
+            with file_path.open(encoding="utf-8") as f:
+                if f.readline().rstrip("\n") != "---":
+                    continue
+                line = f.readline()
+            if line.startswith("gong_id: "):
+                call_ids.add(line[len("gong_id: "):].strip())
+
+        return call_ids
@@ -1,10 +1,15 @@
 """Gong API client with rate limiting and pagination support."""
 
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Generator
+from typing import Any, Callable, Generator
 
 import httpx
+import orjson
+from pydantic import TypeAdapter
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
 from .models import (
@@ -16,6 +21,11 @@ from .models import (
     User,
 )
 
+# Validate whole lists in one pydantic-core call instead of per item
+_PARTIES_ADAPTER = TypeAdapter(list[Participant])
+_CALLS_ADAPTER = TypeAdapter(list[CallMetadata])
+_TRANSCRIPTS_ADAPTER = TypeAdapter(list[CallTranscript])
+
 
 class GongRateLimitError(Exception):
     """Raised when rate limit is exceeded."""
@@ -36,20 +46,58 @@ class GongClient:
 
     DEFAULT_BASE_URL = "https://api.gong.io"
     RATE_LIMIT_REQUESTS_PER_SECOND = 3
-    MIN_REQUEST_INTERVAL = 1.0 / RATE_LIMIT_REQUESTS_PER_SECOND
+    MAX_IDS_PER_REQUEST = 100
 
-    def __init__(self, access_key: str, secret_key: str, base_url: str | None = None):
+    def __init__(
+        self,
+        access_key: str,
+        secret_key: str,
+        base_url: str | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
         self.auth = httpx.BasicAuth(access_key, secret_key)
         self.base_url = (base_url or self.DEFAULT_BASE_URL).rstrip("/")
-        self._last_request_time = 0.0
+        # Clock and sleep used by the throttle, injectable for tests
+        self._clock = clock
+        self._sleep = sleep
+        # Start times of the most recent requests: a sliding window that
+        # admits bursts but never more than the per-second budget in any second
+        self._request_times: deque[float] = deque(maxlen=self.RATE_LIMIT_REQUESTS_PER_SECOND)
+        self._throttle_lock = threading.Lock()
         self._users_cache: dict[str, User] = {}
+        # One pooled HTTP/2 connection reused across requests instead of a
+        # fresh TCP+TLS handshake per call
+        self._client = httpx.Client(
+            auth=self.auth,
+            http2=True,
+            timeout=30.0,
+            headers={"Content-Type": "application/json"},
+            limits=httpx.Limits(max_keepalive_connections=8, max_connections=16),
+        )
+
+    def close(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        self._client.close()
+
+    def __enter__(self) -> "GongClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def _throttle(self) -> None:
-        """Ensure we don't exceed rate limits."""
-        elapsed = time.time() - self._last_request_time
-        if elapsed < self.MIN_REQUEST_INTERVAL:
-            time.sleep(self.MIN_REQUEST_INTERVAL - elapsed)
-        self._last_request_time = time.time()
+        """Ensure we don't exceed rate limits, even across threads."""
+        with self._throttle_lock:
+            now = self._clock()
+            times = self._request_times
+            start = now
+            if len(times) == times.maxlen:
+                # The oldest request in the window must be a full second old
+                start = max(now, times[0] + 1.0)
+                if start > now:
+                    self._sleep(start - now)
+            times.append(start)
 
     @retry(
         retry=retry_if_exception_type(GongRateLimitError),
@@ -63,19 +111,22 @@ class GongClient:
         params: dict[str, Any] | None = None,
         json: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
-        """Make a request to the Gong API with rate limiting."""
+        """Make a request to the Gong API, retrying when rate limited."""
+        return self._send(method, endpoint, params=params, json=json)
+
+    def _send(
+        self,
+        method: str,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Make a single request to the Gong API with rate limiting."""
         self._throttle()
 
         url = f"{self.base_url}/v2{endpoint}"
 
-        with httpx.Client(auth=self.auth, timeout=30.0) as client:
-            response = client.request(
-                method=method,
-                url=url,
-                params=params,
-                json=json,
-                headers={"Content-Type": "application/json"},
-            )
+        response = self._client.request(method=method, url=url, params=params, json=json)
 
         if response.status_code == 429:
             retry_after = int(response.headers.get("Retry-After", 60))
@@ -84,39 +135,71 @@ class GongClient:
         if response.status_code >= 400:
             raise GongAPIError(f"API error {response.status_code}: {response.text}")
 
-        return response.json()
+        # Parse the raw bytes directly: faster than stdlib json on large
+        # transcript payloads and skips httpx's charset detection
+        return orjson.loads(response.content)
 
-    def _paginate_post(
+    @staticmethod
+    def _next_cursor(result: dict[str, Any]) -> str | None:
+        """Extract the next-page cursor from a response, if any."""
+        # Gong uses records.cursor structure
+        records_info = result.get("records", {})
+        cursor = records_info.get("cursor") if isinstance(records_info, dict) else None
+
+        if not cursor:
+            # Also check top-level cursor
+            cursor = result.get("cursor")
+
+        return cursor
+
+    def _paginate_pages(
         self,
+        method: str,
         endpoint: str,
+        params: dict[str, Any] | None = None,
         json_body: dict[str, Any] | None = None,
-        data_key: str = "records",
     ) -> Generator[dict[str, Any], None, None]:
-        """Paginate through API results using POST with cursor in body."""
-        cursor = None
+        """
+        Yield raw response pages, following cursors.
+
+        The next page is requested in the background while the caller
+        consumes the current one. Only one page is prefetched so no rate
+        limit budget is spent speculatively.
+        """
+
+        def fetch(cursor: str | None) -> dict[str, Any]:
+            if method == "GET":
+                request_params = params.copy() if params else {}
+                if cursor:
+                    request_params["cursor"] = cursor
+                return self._request(method, endpoint, params=request_params)
 
-        while True:
             body = json_body.copy() if json_body else {}
             if cursor:
                 body["cursor"] = cursor
+            return self._request(method, endpoint, json=body)
 
-            result = self._request("POST", endpoint, json=body)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            result = fetch(None)
+            while True:
+                cursor = self._next_cursor(result)
+                next_page = executor.submit(fetch, cursor) if cursor else None
 
-            # Yield items from the response
-            items = result.get(data_key, [])
-            for item in items:
-                yield item
+                yield result
 
-            # Check for next page
-            records_info = result.get("records", {})
-            cursor = records_info.get("cursor") if isinstance(records_info, dict) else None
+                if next_page is None:
+                    break
+                result = next_page.result()
 
-            if not cursor:
-                # Also check top-level cursor
-                cursor = result.get("cursor")
-
-            if not cursor:
-                break
+    def _paginate_post(
+        self,
+        endpoint: str,
+        json_body: dict[str, Any] | None = None,
+        data_key: str = "records",
+    ) -> Generator[dict[str, Any], None, None]:
+        """Paginate through API results using POST with cursor in body."""
+        for page in self._paginate_pages("POST", endpoint, json_body=json_body):
+            yield from page.get(data_key, [])
 
     def _paginate_get(
         self,
@@ -125,30 +208,8 @@ class GongClient:
         data_key: str = "records",
     ) -> Generator[dict[str, Any], None, None]:
         """Paginate through API results using GET with cursor in query params."""
-        cursor = None
-
-        while True:
-            request_params = params.copy() if params else {}
-            if cursor:
-                request_params["cursor"] = cursor
-
-            result = self._request("GET", endpoint, params=request_params)
-
-            # Yield items from the response
-            items = result.get(data_key, [])
-            for item in items:
-                yield item
-
-            # Check for next page - Gong uses records.cursor structure
-            records_info = result.get("records", {})
-            cursor = records_info.get("cursor") if isinstance(records_info, dict) else None
-
-            if not cursor:
-                # Also check top-level cursor
-                cursor = result.get("cursor")
-
-            if not cursor:
-                break
+        for page in self._paginate_pages("GET", endpoint, params=params):
+            yield from page.get(data_key, [])
 
     def _paginate(
         self,
@@ -165,16 +226,15 @@ class GongClient:
 
     def get_users(self) -> list[User]:
         """Get all users from Gong."""
-        if self._users_cache:
-            return list(self._users_cache.values())
-
-        users = []
-        for user_data in self._paginate("GET", "/users", data_key="users"):
-            user = User.model_validate(user_data)
-            users.append(user)
-            self._users_cache[user.id] = user
+        if not self._users_cache:
+            self._users_cache = {
+                user.id: user
+                for user in map(
+                    User.model_validate, self._paginate("GET", "/users", data_key="users")
+                )
+            }
 
-        return users
+        return list(self._users_cache.values())
 
     def get_user_by_id(self, user_id: str) -> User | None:
         """Get a user by ID, using cache."""
@@ -204,37 +264,59 @@ class GongClient:
         if to_date:
             params["toDateTime"] = self._format_datetime(to_date)
 
-        for call_data in self._paginate_get("/calls", params=params, data_key="calls"):
+        for page in self._paginate_pages("GET", "/calls", params=params):
+            calls = page.get("calls", [])
             # Filter by scope if specified
-            if scope and call_data.get("scope") != scope:
-                continue
-            yield CallMetadata.model_validate(call_data)
+            if scope:
+                calls = [c for c in calls if c.get("scope") == scope]
+            yield from _CALLS_ADAPTER.validate_python(calls)
+
+    def _post_in_chunks(
+        self, endpoint: str, call_ids: list[str], build_body: Callable[[list[str]], dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """
+        POST call IDs in chunks of MAX_IDS_PER_REQUEST, in parallel.
+
+        Requests still go through the shared throttle, but the server
+        processes several chunks at once instead of one after another.
+        """
+        chunks = [
+            call_ids[i : i + self.MAX_IDS_PER_REQUEST]
+            for i in range(0, len(call_ids), self.MAX_IDS_PER_REQUEST)
+        ]
+        if len(chunks) == 1:
+            return [self._request("POST", endpoint, json=build_body(chunks[0]))]
+
+        with ThreadPoolExecutor(max_workers=self.RATE_LIMIT_REQUESTS_PER_SECOND) as executor:
+            return list(
+                executor.map(
+                    lambda chunk: self._request("POST", endpoint, json=build_body(chunk)),
+                    chunks,
+                )
+            )
 
     def get_calls_extensive(self, call_ids: list[str]) -> dict[str, dict[str, Any]]:
         """Get extensive call data including participants."""
         if not call_ids:
             return {}
 
-        # API allows max 100 calls per request
-        result = {}
-        for i in range(0, len(call_ids), 100):
-            batch_ids = call_ids[i : i + 100]
-
-            response = self._request(
-                "POST",
-                "/calls/extensive",
-                json={
-                    "filter": {"callIds": batch_ids},
-                    "contentSelector": {
-                        "exposedFields": {
-                            "parties": True,
-                            "content": {"trackers": True},
-                            "collaboration": {"publicComments": True},
-                        }
-                    },
+        responses = self._post_in_chunks(
+            "/calls/extensive",
+            call_ids,
+            lambda chunk: {
+                "filter": {"callIds": chunk},
+                "contentSelector": {
+                    "exposedFields": {
+                        "parties": True,
+                        "content": {"trackers": True},
+                        "collaboration": {"publicComments": True},
+                    }
                 },
-            )
+            },
+        )
 
+        result = {}
+        for response in responses:
             for call_data in response.get("calls", []):
                 call_id = call_data.get("metaData", {}).get("id")
                 if call_id:
@@ -247,22 +329,17 @@ class GongClient:
         if not call_ids:
             return {}
 
-        result = {}
-
-        # API allows max 100 calls per request
-        for i in range(0, len(call_ids), 100):
-            batch_ids = call_ids[i : i + 100]
-
-            response = self._request(
-                "POST",
-                "/calls/transcript",
-                json={"filter": {"callIds": batch_ids}},
-            )
+        responses = self._post_in_chunks(
+            "/calls/transcript",
+            call_ids,
+            lambda chunk: {"filter": {"callIds": chunk}},
+        )
 
-            for transcript_data in response.get("callTranscripts", []):
-                call_id = transcript_data.get("callId")
-                if call_id:
-                    result[call_id] = CallTranscript.model_validate(transcript_data)
+        result = {}
+        for response in responses:
+            transcripts = [t for t in response.get("callTranscripts", []) if t.get("callId")]
+            for transcript in _TRANSCRIPTS_ADAPTER.validate_python(transcripts):
+                result[transcript.call_id] = transcript
 
         return result
 
@@ -271,14 +348,22 @@ class GongClient:
         from_date: datetime | None = None,
         to_date: datetime | None = None,
         scope: str | None = "External",
+        skip_ids: Callable[[str], bool] | None = None,
     ) -> Generator[Call, None, None]:
-        """Get full call data with participants and transcripts."""
-        # Collect call IDs in batches
-        call_batch: list[str] = []
+        """
+        Get full call data with participants and transcripts.
+
+        Calls for which skip_ids returns True (e.g. already synced) are
+        dropped before their extensive data and transcripts are fetched.
+        """
+        # Collect call metadata in batches
+        call_batch: list[CallMetadata] = []
         batch_size = 50
 
         for call_meta in self.list_calls(from_date=from_date, to_date=to_date, scope=scope):
-            call_batch.append(call_meta.id)
+            if skip_ids and skip_ids(call_meta.id):
+                continue
+            call_batch.append(call_meta)
 
             if len(call_batch) >= batch_size:
                 yield from self._process_call_batch(call_batch)
@@ -288,35 +373,39 @@ class GongClient:
         if call_batch:
             yield from self._process_call_batch(call_batch)
 
-    def _process_call_batch(self, call_ids: list[str]) -> Generator[Call, None, None]:
-        """Process a batch of calls."""
-        # Get extensive data and transcripts
-        extensive_data = self.get_calls_extensive(call_ids)
-        transcripts = self.get_transcripts(call_ids)
+    def _process_call_batch(
+        self, batch: list[CallMetadata]
+    ) -> Generator[Call, None, None]:
+        """Process a batch of calls, reusing the metadata already validated by list_calls."""
+        call_ids = [call_meta.id for call_meta in batch]
+
+        # Extensive data and transcripts are independent, fetch them concurrently
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            extensive_future = executor.submit(self.get_calls_extensive, call_ids)
+            transcripts_future = executor.submit(self.get_transcripts, call_ids)
+            extensive_data = extensive_future.result()
+            transcripts = transcripts_future.result()
 
-        for call_id in call_ids:
-            ext_data = extensive_data.get(call_id, {})
-            transcript = transcripts.get(call_id)
+        for metadata in batch:
+            ext_data = extensive_data.get(metadata.id, {})
+            transcript = transcripts.get(metadata.id)
 
             if not ext_data:
                 continue
 
-            # Build the Call object
-            metadata = CallMetadata.model_validate(ext_data.get("metaData", {}))
-
-            parties = [
-                Participant.model_validate(p) for p in ext_data.get("parties", [])
-            ]
+            # Build the Call object; every part is already validated (context is
+            # free-form JSON), so skip a second validation pass over them
+            parties = _PARTIES_ADAPTER.validate_python(ext_data.get("parties", []))
 
             transcript_segments: list[TranscriptSegment] = []
             if transcript:
                 transcript_segments = transcript.transcript
 
-            call = Call(
-                metaData=metadata,
+            call = Call.model_construct(
+                metadata=metadata,
                 parties=parties,
                 transcript=transcript_segments,
-                context=ext_data.get("context", []),
+                context=ext_data.get("context") or [],
             )
 
             yield call
@@ -1,31 +1,66 @@
 """Convert Gong calls to Markdown format."""
 
+import io
 import re
+from collections.abc import Mapping, Sequence
 from datetime import datetime
+from functools import cache, lru_cache
+from operator import attrgetter
 
-from .models import Affiliation, Call, Participant, TranscriptSegment
+from .models import (
+    Affiliation,
+    Call,
+    ClientIndexEntry,
+    Participant,
+    TranscriptSegment,
+    client_name_from_domain,
+)
 
+# Affiliation members are compared by identity
+_INTERNAL = Affiliation.INTERNAL
+_EXTERNAL = Affiliation.EXTERNAL
 
+
+@cache
+def _slug_patterns() -> tuple[re.Pattern[str], re.Pattern[str], dict[int, None]]:
+    """Compile the slug regexes on first use, keeping them off the CLI import path."""
+    strip = re.compile(r"[^\w\s-]")
+    # Same deletions as `strip` for ASCII text, derived from the regex itself
+    ascii_strip = {i: None for i in range(128) if strip.match(chr(i))}
+    return strip, re.compile(r"[-\s]+"), ascii_strip
+
+
+@lru_cache(maxsize=4096)
 def slugify(text: str) -> str:
     """Convert text to a URL-friendly slug."""
+    strip, dash, ascii_strip = _slug_patterns()
     text = text.lower()
-    text = re.sub(r"[^\w\s-]", "", text)
-    text = re.sub(r"[-\s]+", "-", text)
-    return text.strip("-")
+    text = text.translate(ascii_strip) if text.isascii() else strip.sub("", text)
+    return dash.sub("-", text).strip("-")
+
+
+def _ymd(d: datetime) -> str:
+    """Format a date as YYYY-MM-DD without going through strftime."""
+    return f"{d.year:04d}-{d.month:02d}-{d.day:02d}"
 
 
+def _ymd_hm(d: datetime) -> str:
+    """Format a datetime as YYYY-MM-DD HH:MM without going through strftime."""
+    return f"{d.year:04d}-{d.month:02d}-{d.day:02d} {d.hour:02d}:{d.minute:02d}"
+
+
+@lru_cache(maxsize=8192)
 def format_timestamp(ms: int) -> str:
     """Format milliseconds as [HH:MM:SS] or [MM:SS]."""
-    total_seconds = ms // 1000
-    hours = total_seconds // 3600
-    minutes = (total_seconds % 3600) // 60
-    seconds = total_seconds % 60
+    hours, rem = divmod(ms // 1000, 3600)
+    minutes, seconds = divmod(rem, 60)
 
     if hours > 0:
         return f"[{hours:02d}:{minutes:02d}:{seconds:02d}]"
     return f"[{minutes:02d}:{seconds:02d}]"
 
 
+@lru_cache(maxsize=8192)
 def format_duration(seconds: int) -> str:
     """Format duration in a human-readable way."""
     hours = seconds // 3600
@@ -38,92 +73,98 @@ def format_duration(seconds: int) -> str:
 
 def get_speaker_name(
     speaker_id: str,
-    parties: list[Participant],
+    parties: Sequence[Participant] | Mapping[str, Participant],
 ) -> tuple[str, Affiliation | None]:
-    """Resolve speaker ID to name and affiliation."""
-    for party in parties:
-        if party.speaker_id == speaker_id:
-            name = party.name or party.email_address or f"Speaker {speaker_id[:8]}"
-            return name, party.affiliation
+    """Resolve speaker ID to name and affiliation, from a party list or a speaker ID index."""
+    if isinstance(parties, Mapping):
+        party = parties.get(speaker_id)
+    else:
+        party = next((p for p in parties if p.speaker_id == speaker_id), None)
+
+    if party is None:
+        return f"Speaker {speaker_id[:8]}", None
 
-    return f"Speaker {speaker_id[:8]}", None
+    name = party.name or party.email_address or f"Speaker {speaker_id[:8]}"
+    return name, party.affiliation
 
 
 def format_participant(participant: Participant) -> str:
     """Format a participant for display."""
-    parts = []
-
     name = participant.name or participant.email_address or "Unknown"
-    parts.append(name)
-
-    affiliation = "Internal" if participant.affiliation == Affiliation.INTERNAL else "External"
-    parts.append(f"({affiliation})")
+    affiliation = "Internal" if participant.affiliation is _INTERNAL else "External"
 
     if participant.title:
-        parts.append(f"- {participant.title}")
+        return f"{name} ({affiliation}) - {participant.title}"
+    return f"{name} ({affiliation})"
 
-    return " ".join(parts)
+
+def _yaml_quote(value: str) -> str:
+    """Quote a string for YAML, escaping embedded double quotes."""
+    return '"' + value.replace('"', '\\"') + '"'
+
+
+# Optional frontmatter fields as (key, getter, formatter), in output order;
+# empty values are omitted
+_FRONTMATTER_FIELDS = (
+    ("date", attrgetter("metadata.started"), datetime.isoformat),
+    ("duration_seconds", attrgetter("metadata.duration"), str),
+    ("title", attrgetter("metadata.title"), _yaml_quote),
+    ("client", attrgetter("client_name"), str),
+    ("gong_url", attrgetter("metadata.url"), str),
+    ("scope", attrgetter("metadata.scope"), str),
+    ("system", attrgetter("metadata.system"), str),
+)
 
 
 def call_to_markdown(call: Call) -> str:
     """Convert a Call to Markdown format."""
-    lines: list[str] = []
+    # Every line is written with its newline; the last one is dropped on return
+    buf = io.StringIO()
+    w = buf.write
+
+    # Read the participant lists once, they are used twice below
+    internal, external = call.partition_parties()
 
     # YAML Frontmatter
-    lines.append("---")
-    lines.append(f"gong_id: {call.metadata.id}")
-    if call.metadata.started:
-        lines.append(f"date: {call.metadata.started.isoformat()}")
-    if call.metadata.duration:
-        lines.append(f"duration_seconds: {call.metadata.duration}")
-    if call.metadata.title:
-        # Escape quotes in title for YAML
-        safe_title = call.metadata.title.replace('"', '\\"')
-        lines.append(f'title: "{safe_title}"')
-    if call.client_name:
-        lines.append(f"client: {call.client_name}")
-    if call.metadata.url:
-        lines.append(f"gong_url: {call.metadata.url}")
-    if call.metadata.scope:
-        lines.append(f"scope: {call.metadata.scope}")
-    if call.metadata.system:
-        lines.append(f"system: {call.metadata.system}")
+    w("---\n")
+    w(f"gong_id: {call.metadata.id}\n")
+    for key, get, fmt in _FRONTMATTER_FIELDS:
+        value = get(call)
+        if value:
+            w(f"{key}: {fmt(value)}\n")
 
     # Participant emails
-    internal_emails = [p.email_address for p in call.internal_participants if p.email_address]
-    external_emails = [p.email_address for p in call.external_participants if p.email_address]
+    internal_emails = [email for p in internal if (email := p.email_address)]
+    external_emails = [email for p in external if (email := p.email_address)]
     if internal_emails:
-        lines.append(f"internal_participants: {internal_emails}")
+        w(f"internal_participants: {internal_emails}\n")
     if external_emails:
-        lines.append(f"external_participants: {external_emails}")
+        w(f"external_participants: {external_emails}\n")
 
-    lines.append("---")
-    lines.append("")
+    w("---\n\n")
 
     # Title
     title = call.metadata.title or "Untitled Call"
-    lines.append(f"# {title}")
-    lines.append("")
+    w(f"# {title}\n\n")
 
     # Metadata
     if call.metadata.started:
-        date_str = call.metadata.started.strftime("%Y-%m-%d %H:%M")
-        lines.append(f"**Date:** {date_str}")
+        date_str = _ymd_hm(call.metadata.started)
+        w(f"**Date:** {date_str}\n")
 
     if call.metadata.duration:
-        lines.append(f"**Duration:** {format_duration(call.metadata.duration)}")
+        w(f"**Duration:** {format_duration(call.metadata.duration)}\n")
 
     # Participants
     if call.parties:
-        lines.append("")
-        lines.append("**Participants:**")
+        w("\n**Participants:**\n")
 
         # Internal first, then external
-        for participant in call.internal_participants:
-            lines.append(f"- {format_participant(participant)}")
+        for participant in internal:
+            w(f"- {format_participant(participant)}\n")
 
-        for participant in call.external_participants:
-            lines.append(f"- {format_participant(participant)}")
+        for participant in external:
+            w(f"- {format_participant(participant)}\n")
 
     # System info
     meta_parts = []
@@ -135,38 +176,34 @@ def call_to_markdown(call: Call) -> str:
         meta_parts.append(f"**Media:** {call.metadata.media}")
 
     if meta_parts:
-        lines.append("")
-        lines.append(" | ".join(meta_parts))
+        w(f"\n{' | '.join(meta_parts)}\n")
 
     # Gong URL
     if call.metadata.url:
-        lines.append("")
-        lines.append(f"[View in Gong]({call.metadata.url})")
+        w(f"\n[View in Gong]({call.metadata.url})\n")
 
     # Transcript
     if call.transcript:
-        lines.append("")
-        lines.append("---")
-        lines.append("")
-        lines.append("## Transcript")
-        lines.append("")
+        w("\n---\n\n## Transcript\n\n")
+
+        # Index parties by speaker once per call rather than scanning them per
+        # segment (reversed so the first matching party wins, as with a list)
+        speakers = {p.speaker_id: p for p in reversed(call.parties) if p.speaker_id}
 
         for segment in call.transcript:
-            speaker_name, affiliation = get_speaker_name(segment.speaker_id, call.parties)
+            speaker_name, affiliation = get_speaker_name(segment.speaker_id, speakers)
 
             # Add affiliation indicator
-            if affiliation == Affiliation.EXTERNAL:
+            if affiliation is _EXTERNAL:
                 speaker_display = f"{speaker_name} (Client)"
             else:
                 speaker_display = speaker_name
 
             for sentence in segment.sentences:
                 timestamp = format_timestamp(sentence.start_ms)
-                lines.append(f"**{timestamp} {speaker_display}:**")
-                lines.append(sentence.text)
-                lines.append("")
+                w(f"**{timestamp} {speaker_display}:**\n{sentence.text}\n\n")
 
-    return "\n".join(lines)
+    return buf.getvalue()[:-1]
 
 
 def generate_filename(call: Call) -> str:
@@ -174,7 +211,7 @@ def generate_filename(call: Call) -> str:
     # Format: YYYY-MM-DD-[title-slug].md
     date_prefix = "unknown-date"
     if call.metadata.started:
-        date_prefix = call.metadata.started.strftime("%Y-%m-%d")
+        date_prefix = _ymd(call.metadata.started)
 
     title = call.metadata.title or call.metadata.id
     title_slug = slugify(title)[:50]  # Limit length
@@ -190,8 +227,7 @@ def generate_client_folder_name(call: Call) -> str:
         # Try to extract from external participants
         for party in call.external_participants:
             if party.email_address:
-                domain = party.email_address.split("@")[-1]
-                client_name = domain.split(".")[0].title()
+                client_name = client_name_from_domain(party.email_address.rpartition("@")[2])
                 break
 
     if not client_name:
@@ -200,41 +236,86 @@ def generate_client_folder_name(call: Call) -> str:
     return slugify(client_name)
 
 
-def generate_client_index(client_name: str, calls: list[Call]) -> str:
-    """Generate an index markdown file for a client."""
+def render_call(call: Call) -> tuple[str, str]:
+    """Render a call to its (filename, markdown) pair."""
+    return generate_filename(call), call_to_markdown(call)
+
+
+def client_index_entry(call: Call) -> ClientIndexEntry:
+    """Summarize a call for the client index, without its transcript."""
+    return ClientIndexEntry(
+        filename=generate_filename(call),
+        title=call.metadata.title,
+        started=call.metadata.started,
+        duration=call.metadata.duration,
+        participant_count=len(call.parties),
+    )
+
+
+def parse_client_index_rows(content: str) -> dict[str, str]:
+    """Map each transcript filename listed in a client index to its table row."""
+    rows: dict[str, str] = {}
+    for line in content.splitlines():
+        # The filename link is the last one in a row; titles come before it
+        _, link, rest = line.rpartition("](./")
+        if link and line.startswith("| "):
+            rows[rest.partition(")")[0]] = line
+    return rows
+
+
+def _row_date(row: str) -> str:
+    """Return the YYYY-MM-DD date cell of an index row, empty for undated rows."""
+    date = row[2:12]
+    return date if date[:1].isdigit() else ""
+
+
+def generate_client_index(
+    client_name: str,
+    entries: list[ClientIndexEntry],
+    existing_rows: Mapping[str, str] | None = None,
+) -> str:
+    """
+    Generate an index markdown file for a client.
+
+    Rows of `existing_rows` (filename -> row, see parse_client_index_rows) are
+    kept for transcripts not among `entries`, so calls synced by earlier runs
+    stay listed.
+    """
+    # Sort calls by date (newest first), undated calls last in their original
+    # order; sorting only dated entries lets the key be a C-level attrgetter
+    sorted_entries = sorted(
+        [e for e in entries if e.started],
+        key=attrgetter("started"),
+        reverse=True,
+    )
+    sorted_entries.extend(e for e in entries if not e.started)
+
+    _format_duration = format_duration
+    rows = [
+        f"| {_ymd(e.started) if e.started else 'N/A'} "
+        f"| [{e.title or 'Untitled'}](./{e.filename}) "
+        f"| {_format_duration(e.duration) if e.duration else 'N/A'} "
+        f"| {e.participant_count} |"
+        for e in sorted_entries
+    ]
+
+    if existing_rows:
+        listed = {e.filename for e in entries}
+        rows.extend(row for name, row in existing_rows.items() if name not in listed)
+        # Stable, so rows of the same day keep their order, new calls first
+        rows.sort(key=_row_date, reverse=True)
+
     lines: list[str] = []
 
     lines.append(f"# {client_name} - Call History")
     lines.append("")
-    lines.append(f"Total calls: {len(calls)}")
+    lines.append(f"Total calls: {len(rows)}")
     lines.append("")
 
-    # Sort calls by date (newest first)
-    sorted_calls = sorted(
-        calls,
-        key=lambda c: c.metadata.started or datetime.min,
-        reverse=True,
-    )
-
     lines.append("## Calls")
     lines.append("")
     lines.append("| Date | Title | Duration | Participants |")
     lines.append("|------|-------|----------|--------------|")
-
-    for call in sorted_calls:
-        date_str = "N/A"
-        if call.metadata.started:
-            date_str = call.metadata.started.strftime("%Y-%m-%d")
-
-        title = call.metadata.title or "Untitled"
-        filename = generate_filename(call)
-
-        duration = "N/A"
-        if call.metadata.duration:
-            duration = format_duration(call.metadata.duration)
-
-        participants = len(call.parties)
-
-        lines.append(f"| {date_str} | [{title}](./{filename}) | {duration} | {participants} |")
+    lines.extend(rows)
 
     return "\n".join(lines)
@@ -1,22 +1,36 @@
 """Data models for Gong API responses."""
 
 from datetime import datetime
-from enum import Enum
+from enum import StrEnum
+from functools import cached_property, lru_cache
 from typing import Any
 
 from pydantic import AliasChoices, BaseModel, ConfigDict, Field
 
 
-class Affiliation(str, Enum):
+class Affiliation(StrEnum):
+    """Affiliation of a call participant, as reported by Gong."""
+
     INTERNAL = "Internal"
     EXTERNAL = "External"
     UNKNOWN = "Unknown"
 
 
+# Enum members are singletons, so affiliations are compared by identity
+_INTERNAL = Affiliation.INTERNAL
+_EXTERNAL = Affiliation.EXTERNAL
+
+
+@lru_cache(maxsize=1024)
+def client_name_from_domain(domain: str) -> str:
+    """Guess a client name from an email domain, e.g. acme.com -> Acme."""
+    return domain.partition(".")[0].title()
+
+
 class Participant(BaseModel):
     """A participant in a Gong call."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
     id: str
     email_address: str | None = Field(default=None, alias="emailAddress")
@@ -30,7 +44,7 @@ class Participant(BaseModel):
 class CallMetadata(BaseModel):
     """Metadata for a Gong call."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
     id: str
     url: str | None = None
@@ -49,7 +63,7 @@ class CallMetadata(BaseModel):
 class Sentence(BaseModel):
     """A sentence in a transcript."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
     start_ms: int = Field(validation_alias=AliasChoices("startMs", "start"))
     end_ms: int = Field(validation_alias=AliasChoices("endMs", "end"))
@@ -59,7 +73,7 @@ class Sentence(BaseModel):
 class TranscriptSegment(BaseModel):
     """A segment of transcript from one speaker."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
     speaker_id: str = Field(alias="speakerId")
     sentences: list[Sentence]
@@ -77,50 +91,82 @@ class CallTranscript(BaseModel):
 class Call(BaseModel):
     """A complete call with metadata, participants, and transcript."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
+    # Nested models' validators are compiled once with this class; concrete
+    # list types validate faster than abstract Sequence ones
     metadata: CallMetadata = Field(alias="metaData")
     parties: list[Participant] = Field(default_factory=list)
     transcript: list[TranscriptSegment] = Field(default_factory=list)
     context: list[dict[str, Any]] = Field(default_factory=list)
 
-    @property
+    # Computed once per call: the model is frozen, so the value cannot go stale
+    # (model_copy(update=...) would carry it over, so build a new Call instead)
+    @cached_property
     def client_name(self) -> str | None:
         """Extract the client/account name from external participants or context."""
-        # Try to get from Salesforce context
+        # Try to get from Salesforce context, skipping other systems and objects early
         for ctx in self.context:
-            if ctx.get("system") == "Salesforce":
-                for obj in ctx.get("objects", []):
-                    if obj.get("objectType") == "Account":
-                        for field in obj.get("fields", []):
-                            if field.get("name") == "Name":
-                                return field.get("value")
-
-        # Fallback: get company from first external participant's email domain
-        for party in self.parties:
-            if party.affiliation == Affiliation.EXTERNAL and party.email_address:
-                domain = party.email_address.split("@")[-1]
-                # Remove common suffixes
-                company = domain.split(".")[0]
-                return company.title()
+            if ctx.get("system") != "Salesforce":
+                continue
+            for obj in ctx.get("objects", ()):
+                if obj.get("objectType") != "Account":
+                    continue
+                for field in obj.get("fields", ()):
+                    if field.get("name") == "Name":
+                        return field.get("value")
+
+        # Fallback: get company from first external participant's email domain,
+        # reusing the cached partition instead of rescanning every party
+        for party in self.external_participants:
+            if party.email_address:
+                return client_name_from_domain(party.email_address.rpartition("@")[2])
 
         return None
 
+    @cached_property
+    def _partitioned(self) -> tuple[list[Participant], list[Participant]]:
+        """Split parties into (internal, external) in a single pass, once per call."""
+        internal: list[Participant] = []
+        external: list[Participant] = []
+        internal_append = internal.append
+        external_append = external.append
+        for party in self.parties:
+            if party.affiliation is _INTERNAL:
+                internal_append(party)
+            elif party.affiliation is _EXTERNAL:
+                external_append(party)
+        return internal, external
+
     @property
     def external_participants(self) -> list[Participant]:
         """Get all external participants."""
-        return [p for p in self.parties if p.affiliation == Affiliation.EXTERNAL]
+        return self._partitioned[1]
 
     @property
     def internal_participants(self) -> list[Participant]:
         """Get all internal participants."""
-        return [p for p in self.parties if p.affiliation == Affiliation.INTERNAL]
+        return self._partitioned[0]
+
+    def partition_parties(self) -> tuple[list[Participant], list[Participant]]:
+        """Split parties into (internal, external); the lists are shared, do not mutate them."""
+        return self._partitioned
+
+
+class ClientIndexEntry(BaseModel):
+    """Lightweight summary of a synced call, used to build a client's index."""
+
+    filename: str
+    title: str | None = None
+    started: datetime | None = None
+    duration: int | None = None  # in seconds
+    participant_count: int = 0
 
 
 class User(BaseModel):
     """A Gong user."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
     id: str
     email_address: str = Field(alias="emailAddress")
@@ -128,7 +174,7 @@ class User(BaseModel):
     last_name: str | None = Field(default=None, alias="lastName")
     active: bool = True
 
-    @property
+    @cached_property
     def full_name(self) -> str:
         """Get the user's full name."""
         parts = [self.first_name, self.last_name]
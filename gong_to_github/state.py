@@ -1,40 +1,91 @@
 """State management for incremental sync."""
 
-import json
+import os
+from collections.abc import Callable, Iterable
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
-from pydantic import BaseModel, ConfigDict
+import orjson
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field, field_validator
 
 
 class SyncState(BaseModel):
     """State for incremental sync."""
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
-    last_sync_timestamp: datetime | None = None
+    # Unix seconds, so the state file holds a plain integer rather than an ISO
+    # string; last_sync_timestamp is accepted as input for older state files
+    last_sync_epoch: int | None = Field(
+        default=None,
+        validation_alias=AliasChoices("last_sync_epoch", "last_sync_timestamp"),
+    )
+    seen_ids: frozenset[str] = frozenset()
+
+    @field_validator("last_sync_epoch", mode="before")
+    @classmethod
+    def _epoch_from_datetime(cls, value: Any) -> Any:
+        """Convert datetimes, and ISO strings from older state files, to epoch seconds."""
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value)
+        if isinstance(value, datetime):
+            return int(value.timestamp())
+        return value
+
+    @property
+    def last_sync_timestamp(self) -> datetime | None:
+        """Get the last sync time as a local datetime."""
+        if self.last_sync_epoch is None:
+            return None
+        return datetime.fromtimestamp(self.last_sync_epoch)
 
 
 def load_state(state_file: Path) -> SyncState:
     """Load sync state from file."""
-    if not state_file.exists():
+    try:
+        data = state_file.read_bytes()
+    except FileNotFoundError:
         return SyncState()
 
+    # Parse and validate in one pass; malformed JSON surfaces as a
+    # ValidationError, which like a schema mismatch is a ValueError
     try:
-        data = json.loads(state_file.read_text())
-        return SyncState.model_validate(data)
-    except (json.JSONDecodeError, ValueError):
+        return SyncState.model_validate_json(data)
+    except ValueError:
         return SyncState()
 
 
 def save_state(state: SyncState, state_file: Path) -> None:
-    """Save sync state to file."""
-    state_file.parent.mkdir(parents=True, exist_ok=True)
+    """Save sync state to file, atomically so a crash never leaves it truncated."""
+    # orjson serializes datetimes natively; sets are written as sorted lists
+    data = orjson.dumps(state.model_dump(), default=sorted, option=orjson.OPT_INDENT_2)
+
+    tmp_file = state_file.with_name(f".{state_file.name}.tmp")
+    try:
+        f = open(tmp_file, "wb")
+    except FileNotFoundError:
+        # Only the first save into a new directory pays for creating it
+        state_file.parent.mkdir(parents=True, exist_ok=True)
+        f = open(tmp_file, "wb")
+
+    with f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, state_file)
+
 
-    data = state.model_dump(mode="json")
-    state_file.write_text(json.dumps(data, indent=2, default=str))
+def update_last_sync(
+    state: SyncState,
+    timestamp: datetime | None = None,
+    clock: Callable[[], datetime] = datetime.now,
+) -> SyncState:
+    """Return a copy of the state with the last sync timestamp updated, to now by default."""
+    epoch = int((timestamp or clock()).timestamp())
+    return state.model_copy(update={"last_sync_epoch": epoch})
 
 
-def update_last_sync(state: SyncState, timestamp: datetime | None = None) -> None:
-    """Update the last sync timestamp."""
-    state.last_sync_timestamp = timestamp or datetime.now()
+def mark_seen(state: SyncState, call_ids: Iterable[str]) -> SyncState:
+    """Return a copy of the state with the synced call IDs recorded."""
+    return state.model_copy(update={"seen_ids": state.seen_ids.union(call_ids)})
@@ -1,6 +1,9 @@
 """Pytest fixtures for gong-to-github tests."""
 
+from collections.abc import Mapping
 from datetime import datetime
+from types import MappingProxyType
+from typing import Any
 
 import pytest
 
@@ -15,77 +18,244 @@ from gong_to_github.models import (
     User,
 )
 from gong_to_github.state import SyncState
+from tests.helpers import build
 
+# Raw Gong API payloads, built once at import and shared read-only
+_GONG_API_CALLS_RESPONSE = MappingProxyType(
+    {
+        "requestId": "req-123",
+        "records": {
+            "totalRecords": 2,
+            "currentPageSize": 2,
+            "currentPageNumber": 0,
+        },
+        "calls": [
+            {
+                "id": "call-123",
+                "url": "https://app.gong.io/call?id=call-123",
+                "title": "Discovery Call",
+                "scheduled": "2025-01-04T14:00:00Z",
+                "started": "2025-01-04T14:03:00Z",
+                "duration": 1800,
+                "direction": "Conference",
+                "system": "Zoom",
+                "scope": "External",
+                "media": "Video",
+                "language": "eng",
+            },
+            {
+                "id": "call-456",
+                "url": "https://app.gong.io/call?id=call-456",
+                "title": "Demo Call",
+                "scheduled": "2025-01-05T10:00:00Z",
+                "started": "2025-01-05T10:02:00Z",
+                "duration": 2700,
+                "direction": "Conference",
+                "system": "Zoom",
+                "scope": "External",
+                "media": "Video",
+                "language": "eng",
+            },
+        ],
+    }
+)
 
-@pytest.fixture
+
+_GONG_API_TRANSCRIPT_RESPONSE = MappingProxyType(
+    {
+        "requestId": "req-456",
+        "callTranscripts": [
+            {
+                "callId": "call-123",
+                "transcript": [
+                    {
+                        "speakerId": "speaker-1",
+                        "sentences": [
+                            {"startMs": 0, "endMs": 5000, "text": "Hello!"},
+                            {"startMs": 5500, "endMs": 10000, "text": "How are you?"},
+                        ],
+                    },
+                    {
+                        "speakerId": "speaker-2",
+                        "sentences": [
+                            {"startMs": 11000, "endMs": 15000, "text": "I'm doing great!"},
+                        ],
+                    },
+                ],
+            }
+        ],
+    }
+)
+
+
+_GONG_API_EXTENSIVE_RESPONSE = MappingProxyType(
+    {
+        "requestId": "req-789",
+        "calls": [
+            {
+                "metaData": {
+                    "id": "call-123",
+                    "url": "https://app.gong.io/call?id=call-123",
+                    "title": "Discovery Call",
+                    "started": "2025-01-04T14:03:00Z",
+                    "duration": 1800,
+                    "system": "Zoom",
+                    "scope": "External",
+                    "media": "Video",
+                },
+                "parties": [
+                    {
+                        "id": "party-1",
+                        "emailAddress": "john@company.com",
+                        "name": "John Doe",
+                        "title": "AE",
+                        "speakerId": "speaker-1",
+                        "affiliation": "Internal",
+                    },
+                    {
+                        "id": "party-2",
+                        "emailAddress": "jane@acme.com",
+                        "name": "Jane Smith",
+                        "title": "VP Sales",
+                        "speakerId": "speaker-2",
+                        "affiliation": "External",
+                    },
+                ],
+                "context": [],
+            }
+        ],
+    }
+)
+
+
+_GONG_API_USERS_RESPONSE = MappingProxyType(
+    {
+        "requestId": "req-users",
+        "records": {
+            "totalRecords": 2,
+            "currentPageSize": 2,
+            "currentPageNumber": 0,
+        },
+        "users": [
+            {
+                "id": "user-1",
+                "emailAddress": "john@company.com",
+                "firstName": "John",
+                "lastName": "Doe",
+                "active": True,
+            },
+            {
+                "id": "user-2",
+                "emailAddress": "jane@company.com",
+                "firstName": "Jane",
+                "lastName": "Roe",
+                "active": True,
+            },
+        ],
+    }
+)
+
+
+# sample_* fixtures are built on first use, not at collection, then shared for
+# the session. The Gong models are frozen and cache derived properties: build a
+# new one to vary a field rather than model_copy(update=...), and do not mutate
+# the lists
+
+
+@pytest.fixture(scope="session")
 def sample_user() -> User:
     """Create a sample Gong user."""
-    return User(
+    return build(
+        User,
         id="user-123",
-        emailAddress="john.doe@company.com",
-        firstName="John",
-        lastName="Doe",
+        email_address="john.doe@company.com",
+        first_name="John",
+        last_name="Doe",
         active=True,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_internal_participant() -> Participant:
     """Create a sample internal participant."""
-    return Participant(
+    return build(
+        Participant,
         id="party-internal-1",
-        emailAddress="john.doe@company.com",
+        email_address="john.doe@company.com",
         name="John Doe",
         title="Account Executive",
-        speakerId="speaker-1",
+        speaker_id="speaker-1",
         affiliation=Affiliation.INTERNAL,
-        userId="user-123",
+        user_id="user-123",
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_external_participant() -> Participant:
     """Create a sample external participant."""
-    return Participant(
+    return build(
+        Participant,
         id="party-external-1",
-        emailAddress="jane.smith@acme.com",
+        email_address="jane.smith@acme.com",
         name="Jane Smith",
         title="VP of Sales",
-        speakerId="speaker-2",
+        speaker_id="speaker-2",
         affiliation=Affiliation.EXTERNAL,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def parties_by_speaker(
+    sample_internal_participant: Participant,
+    sample_external_participant: Participant,
+) -> dict[str, Participant]:
+    """Index the sample participants by speaker ID."""
+    return {
+        p.speaker_id: p
+        for p in (sample_internal_participant, sample_external_participant)
+        if p.speaker_id
+    }
+
+
+@pytest.fixture(scope="session")
 def sample_transcript_segments() -> list[TranscriptSegment]:
     """Create sample transcript segments."""
     return [
-        TranscriptSegment(
-            speakerId="speaker-1",
+        build(
+            TranscriptSegment,
+            speaker_id="speaker-1",
             sentences=[
-                Sentence(startMs=0, endMs=5000, text="Hi Jane, thanks for joining today!"),
-                Sentence(startMs=5500, endMs=10000, text="How are things at Acme?"),
+                build(Sentence, start_ms=0, end_ms=5000, text="Hi Jane, thanks for joining today!"),
+                build(Sentence, start_ms=5500, end_ms=10000, text="How are things at Acme?"),
             ],
         ),
-        TranscriptSegment(
-            speakerId="speaker-2",
+        build(
+            TranscriptSegment,
+            speaker_id="speaker-2",
             sentences=[
-                Sentence(startMs=11000, endMs=18000, text="Hi John! Things are great, we're growing fast."),
+                build(
+                    Sentence,
+                    start_ms=11000,
+                    end_ms=18000,
+                    text="Hi John! Things are great, we're growing fast.",
+                ),
             ],
         ),
-        TranscriptSegment(
-            speakerId="speaker-1",
+        build(
+            TranscriptSegment,
+            speaker_id="speaker-1",
             sentences=[
-                Sentence(startMs=19000, endMs=25000, text="That's wonderful to hear!"),
+                build(Sentence, start_ms=19000, end_ms=25000, text="That's wonderful to hear!"),
             ],
         ),
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_call_metadata() -> CallMetadata:
     """Create sample call metadata."""
-    return CallMetadata(
+    return build(
+        CallMetadata,
         id="call-123",
         url="https://app.gong.io/call?id=call-123",
         title="Acme Corp - Discovery Call",
@@ -97,11 +267,11 @@ def sample_call_metadata() -> CallMetadata:
         scope="External",
         media="Video",
         language="eng",
-        primaryUserId="user-123",
+        primary_user_id="user-123",
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_call(
     sample_call_metadata: CallMetadata,
     sample_internal_participant: Participant,
@@ -109,8 +279,9 @@ def sample_call(
     sample_transcript_segments: list[TranscriptSegment],
 ) -> Call:
     """Create a sample complete call."""
-    return Call(
-        metaData=sample_call_metadata,
+    return build(
+        Call,
+        metadata=sample_call_metadata,
         parties=[sample_internal_participant, sample_external_participant],
         transcript=sample_transcript_segments,
         context=[
@@ -131,7 +302,7 @@ def sample_call(
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_call_without_salesforce(
     sample_call_metadata: CallMetadata,
     sample_internal_participant: Participant,
@@ -139,26 +310,28 @@ def sample_call_without_salesforce(
     sample_transcript_segments: list[TranscriptSegment],
 ) -> Call:
     """Create a sample call without Salesforce context."""
-    return Call(
-        metaData=sample_call_metadata,
+    return build(
+        Call,
+        metadata=sample_call_metadata,
         parties=[sample_internal_participant, sample_external_participant],
         transcript=sample_transcript_segments,
         context=[],
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_call_minimal() -> Call:
     """Create a minimal call with only required fields."""
-    return Call(
-        metaData=CallMetadata(id="call-minimal"),
+    return build(
+        Call,
+        metadata=build(CallMetadata, id="call-minimal"),
         parties=[],
         transcript=[],
         context=[],
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_sync_state() -> SyncState:
     """Create a sample sync state."""
     return SyncState(
@@ -172,140 +345,25 @@ def empty_sync_state() -> SyncState:
     return SyncState()
 
 
-@pytest.fixture
-def sample_gong_api_calls_response() -> dict:
+@pytest.fixture(scope="session")
+def sample_gong_api_calls_response() -> Mapping[str, Any]:
     """Sample response from Gong /v2/calls endpoint."""
-    return {
-        "requestId": "req-123",
-        "records": {
-            "totalRecords": 2,
-            "currentPageSize": 2,
-            "currentPageNumber": 0,
-        },
-        "calls": [
-            {
-                "id": "call-123",
-                "url": "https://app.gong.io/call?id=call-123",
-                "title": "Discovery Call",
-                "scheduled": "2025-01-04T14:00:00Z",
-                "started": "2025-01-04T14:03:00Z",
-                "duration": 1800,
-                "direction": "Conference",
-                "system": "Zoom",
-                "scope": "External",
-                "media": "Video",
-                "language": "eng",
-            },
-            {
-                "id": "call-456",
-                "url": "https://app.gong.io/call?id=call-456",
-                "title": "Demo Call",
-                "scheduled": "2025-01-05T10:00:00Z",
-                "started": "2025-01-05T10:02:00Z",
-                "duration": 2700,
-                "direction": "Conference",
-                "system": "Zoom",
-                "scope": "External",
-                "media": "Video",
-                "language": "eng",
-            },
-        ],
-    }
+    return _GONG_API_CALLS_RESPONSE
 
 
-@pytest.fixture
-def sample_gong_api_transcript_response() -> dict:
+@pytest.fixture(scope="session")
+def sample_gong_api_transcript_response() -> Mapping[str, Any]:
     """Sample response from Gong /v2/calls/transcript endpoint."""
-    return {
-        "requestId": "req-456",
-        "callTranscripts": [
-            {
-                "callId": "call-123",
-                "transcript": [
-                    {
-                        "speakerId": "speaker-1",
-                        "sentences": [
-                            {"startMs": 0, "endMs": 5000, "text": "Hello!"},
-                            {"startMs": 5500, "endMs": 10000, "text": "How are you?"},
-                        ],
-                    },
-                    {
-                        "speakerId": "speaker-2",
-                        "sentences": [
-                            {"startMs": 11000, "endMs": 15000, "text": "I'm doing great!"},
-                        ],
-                    },
-                ],
-            }
-        ],
-    }
+    return _GONG_API_TRANSCRIPT_RESPONSE
 
 
-@pytest.fixture
-def sample_gong_api_extensive_response() -> dict:
+@pytest.fixture(scope="session")
+def sample_gong_api_extensive_response() -> Mapping[str, Any]:
     """Sample response from Gong /v2/calls/extensive endpoint."""
-    return {
-        "requestId": "req-789",
-        "calls": [
-            {
-                "metaData": {
-                    "id": "call-123",
-                    "url": "https://app.gong.io/call?id=call-123",
-                    "title": "Discovery Call",
-                    "started": "2025-01-04T14:03:00Z",
-                    "duration": 1800,
-                    "system": "Zoom",
-                    "scope": "External",
-                    "media": "Video",
-                },
-                "parties": [
-                    {
-                        "id": "party-1",
-                        "emailAddress": "john@company.com",
-                        "name": "John Doe",
-                        "title": "AE",
-                        "speakerId": "speaker-1",
-                        "affiliation": "Internal",
-                    },
-                    {
-                        "id": "party-2",
-                        "emailAddress": "jane@acme.com",
-                        "name": "Jane Smith",
-                        "title": "VP Sales",
-                        "speakerId": "speaker-2",
-                        "affiliation": "External",
-                    },
-                ],
-                "context": [],
-            }
-        ],
-    }
+    return _GONG_API_EXTENSIVE_RESPONSE
 
 
-@pytest.fixture
-def sample_gong_api_users_response() -> dict:
+@pytest.fixture(scope="session")
+def sample_gong_api_users_response() -> Mapping[str, Any]:
     """Sample response from Gong /v2/users endpoint."""
-    return {
-        "requestId": "req-users",
-        "records": {
-            "totalRecords": 2,
-            "currentPageSize": 2,
-            "currentPageNumber": 0,
-        },
-        "users": [
-            {
-                "id": "user-1",
-                "emailAddress": "john@company.com",
-                "firstName": "John",
-                "lastName": "Doe",
-                "active": True,
-            },
-            {
-                "id": "user-2",
-                "emailAddress": "jane@company.com",
-                "firstName": "Jane",
-                "lastName": "Roe",
-                "active": True,
-            },
-        ],
-    }
+    return _GONG_API_USERS_RESPONSE
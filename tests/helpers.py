@@ -0,0 +1,18 @@
+"""Helpers shared by the test modules."""
+
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def build(model: type[M], **data: Any) -> M:
+    """
+    Construct a model from trusted field values, skipping validation.
+
+    Only for fixtures whose literals are valid by construction: nested models
+    must be passed as instances, and field names are used rather than API
+    aliases. Tests of parsing Gong payloads call model_validate instead.
+    """
+    return model.model_construct(**data)
@@ -1,12 +1,39 @@
 """Tests for CLI."""
 
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
 from click.testing import CliRunner
 
 from gong_to_github.cli import cli
+from gong_to_github.markdown_converter import (
+    client_index_entry,
+    generate_client_index,
+    generate_filename,
+)
+from gong_to_github.models import Call
+
+
+def _variant(call: Call, call_id: str, title: str) -> Call:
+    """Copy a call under another ID and title, so it renders to its own file."""
+    return Call(
+        metaData=call.metadata.model_copy(update={"id": call_id, "title": title}),
+        parties=call.parties,
+        transcript=call.transcript,
+        context=call.context,
+    )
+
+
+def _serve_calls(mock_client: MagicMock, calls: list[Call]) -> None:
+    """Make get_full_calls return the calls its skip_ids predicate keeps, as GongClient does."""
+
+    def get_full_calls(*, skip_ids: Callable[[str], bool] | None = None, **kwargs: Any):
+        return iter([c for c in calls if skip_ids is None or not skip_ids(c.metadata.id)])
+
+    mock_client.get_full_calls.side_effect = get_full_calls
 
 
 class TestCLI:
@@ -34,9 +61,8 @@ class TestCLI:
         self, mock_client_class: MagicMock, runner: CliRunner
     ) -> None:
         """Test that CLI accepts credentials."""
-        mock_client = MagicMock()
+        mock_client = mock_client_class.return_value
         mock_client.get_users.return_value = []
-        mock_client_class.return_value = mock_client
 
         result = runner.invoke(
             cli,
@@ -55,9 +81,8 @@ class TestCLI:
         self, mock_client_class: MagicMock, runner: CliRunner
     ) -> None:
         """Test that CLI reads credentials from environment."""
-        mock_client = MagicMock()
+        mock_client = mock_client_class.return_value
         mock_client.get_users.return_value = []
-        mock_client_class.return_value = mock_client
 
         result = runner.invoke(
             cli,
@@ -85,12 +110,11 @@ class TestListUsersCommand:
         """Test list-users command."""
         from gong_to_github.models import User
 
-        mock_client = MagicMock()
+        mock_client = mock_client_class.return_value
         mock_client.get_users.return_value = [
             User(id="1", emailAddress="john@test.com", firstName="John", lastName="Doe"),
             User(id="2", emailAddress="jane@test.com", firstName="Jane", lastName="Roe"),
         ]
-        mock_client_class.return_value = mock_client
 
         result = runner.invoke(
             cli,
@@ -116,9 +140,8 @@ class TestListCallsCommand:
         self, mock_client_class: MagicMock, runner: CliRunner
     ) -> None:
         """Test list-calls with no calls."""
-        mock_client = MagicMock()
+        mock_client = mock_client_class.return_value
         mock_client.get_full_calls.return_value = iter([])
-        mock_client_class.return_value = mock_client
 
         result = runner.invoke(
             cli,
@@ -128,6 +151,26 @@ class TestListCallsCommand:
         assert result.exit_code == 0
         assert "0 external calls" in result.output
 
+    @patch("gong_to_github.cli.GongClient")
+    def test_list_calls_with_client_filter(
+        self, mock_client_class: MagicMock, runner: CliRunner, sample_call
+    ) -> None:
+        """Test list-calls groups calls by client and applies the filter."""
+        mock_client = mock_client_class.return_value
+
+        args = ["--gong-access-key", "key", "--gong-secret-key", "secret", "list-calls"]
+
+        mock_client.get_full_calls.return_value = iter([sample_call])
+        result = runner.invoke(cli, [*args, "--client", "ACME"])
+        assert result.exit_code == 0
+        assert "[acme-corporation] 1 calls" in result.output
+        assert "2025-01-04: Acme Corp - Discovery Call" in result.output
+
+        mock_client.get_full_calls.return_value = iter([sample_call])
+        result = runner.invoke(cli, [*args, "--client", "bigcorp"])
+        assert result.exit_code == 0
+        assert "0 external calls" in result.output
+
 
 class TestSyncLocalCommand:
     """Tests for sync-local command."""
@@ -146,9 +189,8 @@ class TestSyncLocalCommand:
         tmp_path: Path,
     ) -> None:
         """Test sync-local creates files."""
-        mock_client = MagicMock()
+        mock_client = mock_client_class.return_value
         mock_client.get_full_calls.return_value = iter([sample_call])
-        mock_client_class.return_value = mock_client
 
         output_dir = tmp_path / "output"
         state_file = tmp_path / "state.json"
@@ -171,6 +213,108 @@ class TestSyncLocalCommand:
         transcripts_dir = output_dir / "transcripts"
         assert transcripts_dir.exists()
 
+    @patch("gong_to_github.cli.GongClient")
+    def test_sync_local_reports_existing(
+        self,
+        mock_client_class: MagicMock,
+        runner: CliRunner,
+        sample_call,
+        tmp_path: Path,
+    ) -> None:
+        """Test sync-local counts written and already existing files."""
+        _serve_calls(mock_client_class.return_value, [sample_call])
+
+        args = [
+            "--gong-access-key", "key",
+            "--gong-secret-key", "secret",
+            "sync-local",
+            "--output-dir", str(tmp_path / "output"),
+            "--state-file", str(tmp_path / "state.json"),
+        ]
+
+        result = runner.invoke(cli, args)
+        assert result.exit_code == 0
+        assert "Synced 1 new, 0 already existed" in result.output
+
+        # Calls already on disk are skipped before fetching
+        result = runner.invoke(cli, args)
+        assert result.exit_code == 0
+        assert "Found 0 calls" in result.output
+
+        # --full-sync fetches them again, and finds their files already written
+        result = runner.invoke(cli, [*args, "--full-sync"])
+        assert result.exit_code == 0
+        assert "Synced 0 new, 1 already existed" in result.output
+
+    @patch("gong_to_github.cli.GongClient")
+    def test_sync_local_index_keeps_skipped_calls(
+        self,
+        mock_client_class: MagicMock,
+        runner: CliRunner,
+        sample_call: Call,
+        tmp_path: Path,
+    ) -> None:
+        """Test calls skipped as already synced stay listed in the client index."""
+        calls = [_variant(sample_call, f"call-{i}", f"Call {i}") for i in range(1, 4)]
+        mock_client = mock_client_class.return_value
+        output_dir = tmp_path / "output"
+        args = [
+            "--gong-access-key", "key",
+            "--gong-secret-key", "secret",
+            "sync-local",
+            "--output-dir", str(output_dir),
+            "--state-file", str(tmp_path / "state.json"),
+        ]
+
+        _serve_calls(mock_client, calls[:2])
+        assert runner.invoke(cli, args).exit_code == 0
+
+        # Calls 1 and 2 are on disk, so only call 3 comes back from Gong
+        _serve_calls(mock_client, calls)
+        result = runner.invoke(cli, args)
+        assert result.exit_code == 0
+        assert "Synced 1 new" in result.output
+
+        index = (output_dir / "transcripts" / "acme-corporation" / "README.md").read_text()
+        assert "Total calls: 3" in index
+        for call in calls:
+            assert f"(./{generate_filename(call)})" in index
+
+    @patch("gong_to_github.cli.GongClient")
+    def test_sync_local_same_filename_first_wins(
+        self,
+        mock_client_class: MagicMock,
+        runner: CliRunner,
+        sample_call: Call,
+        tmp_path: Path,
+    ) -> None:
+        """Test two calls rendering to the same file keep the first, as a serial write would."""
+        # Same date and title, so the same filename, but a different call
+        twin = Call(
+            metaData=sample_call.metadata.model_copy(update={"id": "call-456"}),
+            parties=sample_call.parties,
+            context=sample_call.context,
+        )
+        mock_client = mock_client_class.return_value
+        mock_client.get_full_calls.return_value = iter([sample_call, twin])
+        output_dir = tmp_path / "output"
+
+        result = runner.invoke(
+            cli,
+            [
+                "--gong-access-key", "key",
+                "--gong-secret-key", "secret",
+                "sync-local",
+                "--output-dir", str(output_dir),
+                "--state-file", str(tmp_path / "state.json"),
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert "Synced 1 new, 1 already existed" in result.output
+        written = output_dir / "transcripts" / "acme-corporation" / generate_filename(sample_call)
+        assert "gong_id: call-123" in written.read_text()
+
     @patch("gong_to_github.cli.GongClient")
     def test_sync_local_full_sync_flag(
         self,
@@ -179,9 +323,8 @@ class TestSyncLocalCommand:
         tmp_path: Path,
     ) -> None:
         """Test sync-local with --full-sync flag."""
-        mock_client = MagicMock()
+        mock_client = mock_client_class.return_value
         mock_client.get_full_calls.return_value = iter([])
-        mock_client_class.return_value = mock_client
 
         result = runner.invoke(
             cli,
@@ -230,12 +373,10 @@ class TestSyncGithubCommand:
         tmp_path: Path,
     ) -> None:
         """Test sync-github with dry-run."""
-        mock_gong = MagicMock()
+        mock_gong = mock_gong_class.return_value
         mock_gong.get_full_calls.return_value = iter([sample_call])
-        mock_gong_class.return_value = mock_gong
 
-        mock_github = MagicMock()
-        mock_github_class.return_value = mock_github
+        mock_github = mock_github_class.return_value
 
         result = runner.invoke(
             cli,
@@ -254,3 +395,114 @@ class TestSyncGithubCommand:
         assert "[DRY RUN]" in result.output
         # GitHub sync methods should not be called in dry-run
         mock_github.sync_transcript.assert_not_called()
+        mock_github.stage_transcript.assert_not_called()
+        mock_github.commit_staged.assert_not_called()
+
+    @patch("gong_to_github.cli.GitHubSync")
+    @patch("gong_to_github.cli.GongClient")
+    def test_sync_github_single_commit(
+        self,
+        mock_gong_class: MagicMock,
+        mock_github_class: MagicMock,
+        runner: CliRunner,
+        sample_call,
+        tmp_path: Path,
+    ) -> None:
+        """Test sync-github stages every file and commits once."""
+        mock_gong = mock_gong_class.return_value
+        mock_gong.get_full_calls.return_value = iter([sample_call])
+
+        mock_github = mock_github_class.return_value
+        mock_github.stage_transcript.return_value = True
+
+        result = runner.invoke(
+            cli,
+            [
+                "--gong-access-key", "key",
+                "--gong-secret-key", "secret",
+                "sync-github",
+                "--github-token", "gh-token",
+                "--repo", "owner/repo",
+                "--state-file", str(tmp_path / "state.json"),
+            ],
+        )
+
+        assert result.exit_code == 0
+        assert "Synced 1 new" in result.output
+        mock_github.stage_transcript.assert_called_once()
+        mock_github.stage_client_index.assert_called_once()
+        mock_github.commit_staged.assert_called_once()
+        mock_github.close.assert_called_once()
+
+    @patch("gong_to_github.cli.GitHubSync")
+    @patch("gong_to_github.cli.GongClient")
+    def test_sync_github_skips_seen_calls(
+        self,
+        mock_gong_class: MagicMock,
+        mock_github_class: MagicMock,
+        runner: CliRunner,
+        sample_call,
+        tmp_path: Path,
+    ) -> None:
+        """Test calls synced by a previous run are skipped before fetching."""
+        _serve_calls(mock_gong_class.return_value, [sample_call])
+        mock_github = mock_github_class.return_value
+        mock_github.stage_transcript.return_value = True
+
+        args = [
+            "--gong-access-key", "key",
+            "--gong-secret-key", "secret",
+            "sync-github",
+            "--github-token", "gh-token",
+            "--repo", "owner/repo",
+            "--state-file", str(tmp_path / "state.json"),
+        ]
+
+        result = runner.invoke(cli, args)
+        assert result.exit_code == 0
+        assert "Synced 1 new" in result.output
+
+        result = runner.invoke(cli, args)
+        assert result.exit_code == 0
+        assert "Found 0 calls" in result.output
+        mock_github.stage_transcript.assert_called_once()
+
+    @patch("gong_to_github.cli.GitHubSync")
+    @patch("gong_to_github.cli.GongClient")
+    def test_sync_github_index_keeps_seen_calls(
+        self,
+        mock_gong_class: MagicMock,
+        mock_github_class: MagicMock,
+        runner: CliRunner,
+        sample_call: Call,
+        tmp_path: Path,
+    ) -> None:
+        """Test the staged client index keeps calls synced by earlier runs."""
+        old_call = _variant(sample_call, "call-old", "Earlier Call")
+        new_call = _variant(sample_call, "call-new", "Later Call")
+        old_index = generate_client_index("Acme Corporation", [client_index_entry(old_call)])
+
+        _serve_calls(mock_gong_class.return_value, [new_call])
+        mock_github = mock_github_class.return_value
+        mock_github.stage_transcript.return_value = True
+        mock_github.read_client_index.return_value = old_index
+        mock_github.list_existing_transcripts.return_value = [generate_filename(old_call)]
+
+        result = runner.invoke(
+            cli,
+            [
+                "--gong-access-key", "key",
+                "--gong-secret-key", "secret",
+                "sync-github",
+                "--github-token", "gh-token",
+                "--repo", "owner/repo",
+                "--state-file", str(tmp_path / "state.json"),
+            ],
+        )
+
+        assert result.exit_code == 0
+        folder, index = mock_github.stage_client_index.call_args.args
+        assert folder == "acme-corporation"
+        assert "Total calls: 2" in index
+        assert f"(./{generate_filename(old_call)})" in index
+        assert f"(./{generate_filename(new_call)})" in index
@@ -1,144 +1,468 @@
 """Tests for GitHub sync module."""
 
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import pytest
+from github import GithubException
+from pyfakefs.fake_filesystem import FakeFilesystem
 
-from gong_to_github.github_sync import LocalSync
+from gong_to_github.github_sync import GitHubSync, LocalSync
+
+
+class TestGitHubSync:
+    """Tests for GitHubSync class."""
+
+    @pytest.fixture
+    def repo(self) -> MagicMock:
+        """Create a mock PyGithub repository."""
+        return MagicMock()
+
+    @pytest.fixture
+    def github_sync(self, repo: MagicMock) -> GitHubSync:
+        """Create a GitHubSync instance backed by the mock repository."""
+        with patch("gong_to_github.github_sync.Github") as mock_github_class:
+            mock_github_class.return_value.get_repo.return_value = repo
+            return GitHubSync("token", "owner/repo")
+
+    @staticmethod
+    def _tree(*paths: str, truncated: bool = False) -> MagicMock:
+        """Build a mock recursive git tree containing the given blob paths."""
+        tree = MagicMock()
+        tree.tree = [MagicMock(path=p, sha=f"sha-{p}", type="blob") for p in paths]
+        tree.tree.append(MagicMock(path="transcripts/acme", sha="dir", type="tree"))
+        tree.raw_data = {"truncated": truncated}
+        return tree
+
+    def test_close_shuts_down_uploads(self, github_sync: GitHubSync) -> None:
+        """Test closing waits for and shuts down the blob upload pool."""
+        with patch.object(github_sync._uploads, "shutdown") as mock_shutdown:
+            with github_sync:
+                pass
+
+        mock_shutdown.assert_called_once_with()
+
+    def test_get_file_sha_not_found(self, github_sync: GitHubSync, repo: MagicMock) -> None:
+        """Test missing files have no SHA."""
+        repo.get_git_tree.return_value = self._tree()
+        assert github_sync.get_file_sha("transcripts/acme/call.md") is None
+        assert not github_sync.file_exists("transcripts/acme/call.md")
+
+    def test_get_file_sha_from_tree(self, github_sync: GitHubSync, repo: MagicMock) -> None:
+        """Test SHA lookups are served from one recursive tree fetch."""
+        repo.get_git_tree.return_value = self._tree(
+            "transcripts/acme/call-1.md", "transcripts/acme/call-2.md"
+        )
+
+        assert github_sync.get_file_sha("transcripts/acme/call-1.md") == (
+            "sha-transcripts/acme/call-1.md"
+        )
+        assert github_sync.file_exists("transcripts/acme/call-2.md")
+        assert github_sync.get_file_sha("transcripts/acme") is None
+
+        repo.get_git_tree.assert_called_once_with("main", recursive=True)
+        repo.get_contents.assert_not_called()
+
+    def test_get_file_sha_empty_repository(
+        self, github_sync: GitHubSync, repo: MagicMock
+    ) -> None:
+        """Test a repository without commits has no files."""
+        repo.get_git_tree.side_effect = GithubException(409, "Git Repository is empty.")
+        assert github_sync.get_file_sha("transcripts/acme/call.md") is None
+
+    def test_get_file_sha_truncated_tree(
+        self, github_sync: GitHubSync, repo: MagicMock
+    ) -> None:
+        """Test paths missing from a truncated tree are looked up directly."""
+        repo.get_git_tree.return_value = self._tree(truncated=True)
+        repo.get_contents.return_value = MagicMock(sha="abc")
+
+        assert github_sync.get_file_sha("transcripts/acme/call.md") == "abc"
+        assert github_sync.get_file_sha("transcripts/acme/call.md") == "abc"
+        assert repo.get_contents.call_count == 1
+
+    def test_list_existing_transcripts(self, github_sync: GitHubSync, repo: MagicMock) -> None:
+        """Test listing transcripts from the cached tree."""
+        repo.get_git_tree.return_value = self._tree(
+            "transcripts/acme/call-1.md",
+            "transcripts/acme/README.md",
+            "transcripts/acme/notes/other.md",
+            "transcripts/acme-corp/call-2.md",
+        )
+
+        assert github_sync.list_existing_transcripts("acme") == ["call-1.md"]
+        assert github_sync.list_existing_transcripts("nonexistent") == []
+
+    def test_sync_transcript_skips_existing(
+        self, github_sync: GitHubSync, repo: MagicMock
+    ) -> None:
+        """Test existing transcripts are not rewritten by default."""
+        repo.get_git_tree.return_value = self._tree("transcripts/acme/call.md")
+
+        assert github_sync.sync_transcript("acme", "call.md", "content") is False
+        repo.create_file.assert_not_called()
+        repo.update_file.assert_not_called()
+
+    def test_sync_transcript_creates_and_caches_sha(
+        self, github_sync: GitHubSync, repo: MagicMock
+    ) -> None:
+        """Test new transcripts are created and their SHA remembered."""
+        repo.get_git_tree.return_value = self._tree()
+        repo.create_file.return_value = {"content": MagicMock(sha="new-sha")}
+
+        assert github_sync.sync_transcript("acme", "call.md", "content") is True
+        assert github_sync.get_file_sha("transcripts/acme/call.md") == "new-sha"
+        repo.get_git_tree.assert_called_once()
+
+    def test_stage_transcript_skips_existing(
+        self, github_sync: GitHubSync, repo: MagicMock
+    ) -> None:
+        """Test existing transcripts are not staged by default."""
+        repo.get_git_tree.return_value = self._tree("transcripts/acme/call.md")
+
+        assert github_sync.stage_transcript("acme", "call.md", "content") is False
+        assert github_sync.stage_transcript(
+            "acme", "call.md", "content", update_existing=True
+        ) is True
+
+    def test_stage_transcript_skips_duplicate_path(
+        self, github_sync: GitHubSync, repo: MagicMock
+    ) -> None:
+        """Test a path already staged in this batch is not staged again."""
+        repo.get_git_tree.return_value = self._tree()
+        repo.create_git_blob.side_effect = lambda content, encoding: MagicMock(
+            sha=f"blob-{content}"
+        )
+
+        assert github_sync.stage_transcript("acme", "call.md", "first") is True
+        assert github_sync.stage_transcript("acme", "call.md", "second") is False
+
+        github_sync.commit_staged("Sync transcripts")
+        assert github_sync.get_file_sha("transcripts/acme/call.md") == "blob-first"
+
+    def test_read_client_index(self, github_sync: GitHubSync, repo: MagicMock) -> None:
+        """Test a client's index is read from the branch, or None when missing."""
+        repo.get_git_tree.return_value = self._tree("transcripts/acme/README.md")
+        repo.get_contents.return_value = MagicMock(decoded_content=b"# Acme index")
+
+        assert github_sync.read_client_index("acme") == "# Acme index"
+        repo.get_contents.assert_called_once_with("transcripts/acme/README.md", ref="main")
+        assert github_sync.read_client_index("bigcorp") is None
+
+    def test_commit_staged_single_commit(
+        self, github_sync: GitHubSync, repo: MagicMock
+    ) -> None:
+        """Test staged files are pushed as one tree and one commit."""
+        repo.get_git_tree.return_value = self._tree()
+        repo.create_git_blob.side_effect = lambda content, encoding: MagicMock(
+            sha=f"blob-{content}"
+        )
+        ref = repo.get_git_ref.return_value
+        parent = repo.get_git_commit.return_value
+
+        github_sync.stage_transcript("acme", "call-1.md", "one")
+        github_sync.stage_transcript("acme", "call-2.md", "two")
+        github_sync.stage_client_index("acme", "index")
+
+        assert github_sync.commit_staged("Sync transcripts") == 3
+
+        repo.get_git_ref.assert_called_once_with("heads/main")
+        assert repo.create_git_blob.call_count == 3
+        elements = repo.create_git_tree.call_args[0][0]
+        assert sorted(e._identity["path"] for e in elements) == [
+            "transcripts/acme/README.md",
+            "transcripts/acme/call-1.md",
+            "transcripts/acme/call-2.md",
+        ]
+        repo.create_git_commit.assert_called_once_with(
+            "Sync transcripts", repo.create_git_tree.return_value, [parent]
+        )
+        ref.edit.assert_called_once_with(repo.create_git_commit.return_value.sha)
+        assert github_sync.get_file_sha("transcripts/acme/call-1.md") == "blob-one"
+
+    def test_commit_staged_empty_repository(
+        self, github_sync: GitHubSync, repo: MagicMock
+    ) -> None:
+        """Test the first batch to an empty repository starts the branch."""
+        empty = GithubException(409, "Git Repository is empty.")
+        repo.get_git_tree.side_effect = empty
+
+        def create_git_blob(content: str, encoding: str) -> MagicMock:
+            if not repo.create_file.called:
+                raise empty
+            return MagicMock(sha=f"blob-{content}")
+
+        repo.create_git_blob.side_effect = create_git_blob
+        repo.create_file.side_effect = lambda path, message, content, branch: {
+            "content": MagicMock(sha=f"blob-{content}")
+        }
+        repo.get_git_ref.side_effect = empty
+
+        github_sync.stage_transcript("acme", "call-1.md", "one")
+        github_sync.stage_transcript("acme", "call-2.md", "two")
+        github_sync.stage_client_index("acme", "index")
+
+        assert github_sync.commit_staged("Sync transcripts") == 3
+
+        repo.create_file.assert_called_once()
+        elements = repo.create_git_tree.call_args[0][0]
+        assert sorted(e._identity["sha"] for e in elements) == [
+            "blob-index", "blob-one", "blob-two",
+        ]
+        assert "base_tree" not in repo.create_git_tree.call_args.kwargs
+        repo.create_git_commit.assert_called_once_with(
+            "Sync transcripts", repo.create_git_tree.return_value, []
+        )
+        repo.create_git_ref.assert_called_once_with(
+            "refs/heads/main", repo.create_git_commit.return_value.sha
+        )
+        assert github_sync.get_file_sha("transcripts/acme/call-2.md") == "blob-two"
+
+    def test_commit_staged_nothing_staged(
+        self, github_sync: GitHubSync, repo: MagicMock
+    ) -> None:
+        """Test committing with nothing staged makes no API calls."""
+        assert github_sync.commit_staged("Sync transcripts") == 0
+        repo.get_git_ref.assert_not_called()
+
+
+def _bulk_create(folder: Path, files: dict[str, str]) -> None:
+    """Create a folder holding the given files, bypassing LocalSync."""
+    folder.mkdir(parents=True, exist_ok=True)
+    for name, content in files.items():
+        (folder / name).write_bytes(content.encode())
+
+
+class LocalSyncHarness:
+    """A LocalSync with memoized paths into its output tree."""
+
+    def __init__(self, sync: LocalSync) -> None:
+        self.sync = sync
+        self._paths: dict[tuple[str, str], Path] = {}
+
+    def client_dir(self, client: str) -> Path:
+        """Return the transcript folder of a client."""
+        return self.sync.output_dir / "transcripts" / client
+
+    def transcript_path(self, client: str, name: str) -> Path:
+        """Return the path of a file in a client's transcript folder."""
+        path = self._paths.get((client, name))
+        if path is None:
+            path = self._paths[client, name] = self.client_dir(client) / name
+        return path
+
+
+@pytest.fixture(scope="module")
+def harness(fs_module: FakeFilesystem) -> LocalSyncHarness:
+    """Create a LocalSync harness on an in-memory filesystem, shared by this module."""
+    return LocalSyncHarness(LocalSync(Path("/output")))
 
 
 class TestLocalSync:
     """Tests for LocalSync class."""
 
     @pytest.fixture
-    def local_sync(self, tmp_path: Path) -> LocalSync:
-        """Create a LocalSync instance with temp directory."""
-        return LocalSync(tmp_path)
+    def client(self, request: pytest.FixtureRequest) -> str:
+        """Return a client folder unique to the test, isolating it in the shared tree."""
+        return f"acme-{request.node.name}"
 
-    def test_init_creates_directory(self, tmp_path: Path) -> None:
+    def test_init_creates_directory(self, fs_module: FakeFilesystem, client: str) -> None:
         """Test that init creates the output directory."""
-        output_dir = tmp_path / "new_output"
+        output_dir = Path("/new_output") / client
         LocalSync(output_dir)
         assert output_dir.exists()
 
-    def test_sync_transcript_creates_file(self, local_sync: LocalSync) -> None:
+    def test_sync_transcript_creates_file(self, harness: LocalSyncHarness, client: str) -> None:
         """Test syncing a transcript creates the file."""
-        result = local_sync.sync_transcript(
-            client_folder="acme-corp",
+        result = harness.sync.sync_transcript(
+            client_folder=client,
             filename="2025-01-04-discovery.md",
             content="# Test Call\n\nContent here",
         )
 
         assert result is True
-        file_path = local_sync.output_dir / "transcripts" / "acme-corp" / "2025-01-04-discovery.md"
+        file_path = harness.transcript_path(client, "2025-01-04-discovery.md")
         assert file_path.exists()
         assert file_path.read_text() == "# Test Call\n\nContent here"
 
-    def test_sync_transcript_creates_nested_dirs(self, local_sync: LocalSync) -> None:
+    def test_sync_transcript_creates_nested_dirs(
+        self, harness: LocalSyncHarness, client: str
+    ) -> None:
         """Test that sync creates necessary directories."""
-        local_sync.sync_transcript(
-            client_folder="new-client",
+        harness.sync.sync_transcript(
+            client_folder=client,
             filename="call.md",
             content="Content",
         )
 
-        folder = local_sync.output_dir / "transcripts" / "new-client"
+        folder = harness.client_dir(client)
         assert folder.exists()
         assert folder.is_dir()
 
-    def test_sync_transcript_skip_existing(self, local_sync: LocalSync) -> None:
+    def test_sync_transcript_creates_folder_once(
+        self, harness: LocalSyncHarness, client: str
+    ) -> None:
+        """Test the client folder is only created for the first file."""
+        harness.sync.sync_transcript(client, "call-1.md", "content")
+
+        with patch.object(Path, "mkdir") as mock_mkdir:
+            harness.sync.sync_transcript(client, "call-2.md", "content")
+            harness.sync.sync_client_index(client, "index")
+
+        mock_mkdir.assert_not_called()
+
+    def test_sync_transcript_skip_existing(self, harness: LocalSyncHarness, client: str) -> None:
         """Test that sync skips existing files by default."""
         # Create first file
-        local_sync.sync_transcript(
-            client_folder="acme",
+        harness.sync.sync_transcript(
+            client_folder=client,
             filename="call.md",
             content="Original content",
         )
 
         # Try to create again
-        result = local_sync.sync_transcript(
-            client_folder="acme",
+        result = harness.sync.sync_transcript(
+            client_folder=client,
             filename="call.md",
             content="New content",
             update_existing=False,
         )
 
         assert result is False
-        file_path = local_sync.output_dir / "transcripts" / "acme" / "call.md"
+        file_path = harness.transcript_path(client, "call.md")
         assert file_path.read_text() == "Original content"
 
-    def test_sync_transcript_update_existing(self, local_sync: LocalSync) -> None:
+    def test_sync_transcript_update_existing(self, harness: LocalSyncHarness, client: str) -> None:
         """Test that sync can update existing files."""
         # Create first file
-        local_sync.sync_transcript(
-            client_folder="acme",
+        harness.sync.sync_transcript(
+            client_folder=client,
             filename="call.md",
             content="Original content",
         )
 
         # Update
-        result = local_sync.sync_transcript(
-            client_folder="acme",
+        result = harness.sync.sync_transcript(
+            client_folder=client,
             filename="call.md",
             content="Updated content",
             update_existing=True,
         )
 
         assert result is True
-        file_path = local_sync.output_dir / "transcripts" / "acme" / "call.md"
+        file_path = harness.transcript_path(client, "call.md")
         assert file_path.read_text() == "Updated content"
 
-    def test_sync_client_index(self, local_sync: LocalSync) -> None:
+    def test_sync_transcript_update_unchanged(self, harness: LocalSyncHarness, client: str) -> None:
+        """Test that updating with identical content skips the write."""
+        harness.sync.sync_transcript(client, "call.md", "Same content")
+
+        result = harness.sync.sync_transcript(
+            client_folder=client,
+            filename="call.md",
+            content="Same content",
+            update_existing=True,
+        )
+
+        assert result is False
+
+    def test_sync_transcript_leaves_no_temp_files(
+        self, harness: LocalSyncHarness, client: str
+    ) -> None:
+        """Test that atomic writes clean up their temporary file."""
+        harness.sync.sync_transcript(client, "call.md", "Original content")
+        harness.sync.sync_transcript(client, "call.md", "Updated content", update_existing=True)
+
+        folder = harness.client_dir(client)
+        assert [f.name for f in folder.iterdir()] == ["call.md"]
+
+    def test_sync_transcripts_batch(self, harness: LocalSyncHarness, client: str) -> None:
+        """Test syncing several transcripts of one client at once."""
+        _bulk_create(harness.client_dir(client), {"call-1.md": "Original"})
+
+        results = harness.sync.sync_transcripts_batch(
+            client, [("call-1.md", "New"), ("call-2.md", "Content")]
+        )
+
+        assert results == [False, True]
+        folder = harness.client_dir(client)
+        assert (folder / "call-1.md").read_text() == "Original"
+        assert (folder / "call-2.md").read_text() == "Content"
+
+    def test_sync_client_index(self, harness: LocalSyncHarness, client: str) -> None:
         """Test syncing client index."""
-        result = local_sync.sync_client_index(
-            client_folder="acme",
+        result = harness.sync.sync_client_index(
+            client_folder=client,
             content="# Acme - Call History\n\nIndex content",
         )
 
         assert result is True
-        file_path = local_sync.output_dir / "transcripts" / "acme" / "README.md"
+        file_path = harness.transcript_path(client, "README.md")
         assert file_path.exists()
         assert "Call History" in file_path.read_text()
 
-    def test_sync_client_index_always_updates(self, local_sync: LocalSync) -> None:
+    def test_sync_client_index_always_updates(self, harness: LocalSyncHarness, client: str) -> None:
         """Test that client index is always updated."""
         # Create initial index
-        local_sync.sync_client_index("acme", "Initial")
+        harness.sync.sync_client_index(client, "Initial")
 
         # Update index
-        local_sync.sync_client_index("acme", "Updated")
+        harness.sync.sync_client_index(client, "Updated")
 
-        file_path = local_sync.output_dir / "transcripts" / "acme" / "README.md"
+        file_path = harness.transcript_path(client, "README.md")
         assert file_path.read_text() == "Updated"
 
-    def test_list_existing_transcripts_empty(self, local_sync: LocalSync) -> None:
+    def test_read_client_index(self, harness: LocalSyncHarness, client: str) -> None:
+        """Test reading back a client's index, or None before one is written."""
+        assert harness.sync.read_client_index(client) is None
+
+        harness.sync.sync_client_index(client, "# Index")
+
+        assert harness.sync.read_client_index(client) == "# Index"
+
+    def test_list_existing_transcripts_empty(self, harness: LocalSyncHarness) -> None:
         """Test listing transcripts for nonexistent folder."""
-        result = local_sync.list_existing_transcripts("nonexistent")
+        result = harness.sync.list_existing_transcripts("nonexistent")
         assert result == []
 
-    def test_list_existing_transcripts(self, local_sync: LocalSync) -> None:
+    def test_list_existing_transcripts(self, harness: LocalSyncHarness, client: str) -> None:
         """Test listing existing transcripts."""
-        # Create some files
-        local_sync.sync_transcript("acme", "call-1.md", "content")
-        local_sync.sync_transcript("acme", "call-2.md", "content")
-        local_sync.sync_client_index("acme", "index")
+        _bulk_create(
+            harness.client_dir(client),
+            dict.fromkeys(("call-1.md", "call-2.md", "README.md", "notes.txt"), ""),
+        )
 
-        result = local_sync.list_existing_transcripts("acme")
+        result = harness.sync.list_existing_transcripts(client)
 
         assert len(result) == 2
         assert "call-1.md" in result
         assert "call-2.md" in result
         assert "README.md" not in result  # Index excluded
 
-    def test_multiple_clients(self, local_sync: LocalSync) -> None:
+    def test_multiple_clients(self, harness: LocalSyncHarness, client: str) -> None:
         """Test syncing multiple clients."""
-        local_sync.sync_transcript("acme", "call.md", "Acme content")
-        local_sync.sync_transcript("bigcorp", "call.md", "BigCorp content")
+        harness.sync.sync_transcript(client, "call.md", "Acme content")
+        harness.sync.sync_transcript(f"{client}-bigcorp", "call.md", "BigCorp content")
 
-        acme_path = local_sync.output_dir / "transcripts" / "acme" / "call.md"
-        bigcorp_path = local_sync.output_dir / "transcripts" / "bigcorp" / "call.md"
+        acme_path = harness.transcript_path(client, "call.md")
+        bigcorp_path = harness.transcript_path(f"{client}-bigcorp", "call.md")
 
         assert acme_path.exists()
         assert bigcorp_path.exists()
         assert acme_path.read_text() == "Acme content"
         assert bigcorp_path.read_text() == "BigCorp content"
+
+    def test_synced_call_ids(self, fs_module: FakeFilesystem, client: str) -> None:
+        """Test call IDs are read from transcript frontmatter."""
+        local_sync = LocalSync(Path("/isolated") / client)
+        local_sync.sync_transcript("acme", "call-1.md", "---\ngong_id: call-1\ndate: x\n---\n")
+        local_sync.sync_transcript("bigcorp", "call-2.md", "---\ngong_id: call-2\n---\n")
+        local_sync.sync_transcript("acme", "notes.md", "# No frontmatter\n")
+        local_sync.sync_client_index("acme", "---\ngong_id: not-a-call\n")
+
+        assert local_sync.synced_call_ids() == {"call-1", "call-2"}
+
+    def test_synced_call_ids_empty(self, fs_module: FakeFilesystem, client: str) -> None:
+        """Test no IDs are found before the first sync."""
+        local_sync = LocalSync(Path("/isolated") / client)
+        assert local_sync.synced_call_ids() == set()
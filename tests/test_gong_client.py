@@ -1,16 +1,22 @@
 """Tests for Gong API client."""
 
+from collections import deque
+from collections.abc import Generator
 from unittest.mock import MagicMock, patch
 
-import httpx
 import pytest
 
-from gong_to_github.gong_client import (
+# Skip the module up front when httpx is missing, before importing the client
+httpx = pytest.importorskip("httpx")
+
+from gong_to_github.gong_client import (  # noqa: E402
     GongAPIError,
     GongClient,
     GongRateLimitError,
 )
-from gong_to_github.models import CallMetadata, User
+from gong_to_github.models import CallMetadata, CallTranscript, User  # noqa: E402
+
+pytestmark = pytest.mark.network
 
 
 class TestGongRateLimitError:
@@ -23,85 +29,122 @@ class TestGongRateLimitError:
         assert "30 seconds" in str(error)
 
 
+@pytest.fixture(scope="module")
+def shared_client() -> Generator[GongClient, None, None]:
+    """Create one GongClient for the module and close its pool afterwards."""
+    client = GongClient(access_key="test-key", secret_key="test-secret")
+    yield client
+    client.close()
+
+
 class TestGongClient:
     """Tests for GongClient."""
 
     @pytest.fixture
-    def client(self) -> GongClient:
-        """Create a GongClient instance."""
-        return GongClient(access_key="test-key", secret_key="test-secret")
+    def client(self, shared_client: GongClient, monkeypatch: pytest.MonkeyPatch) -> GongClient:
+        """Reuse the shared client, restoring the state tests replace or fill."""
+        monkeypatch.setattr(shared_client, "_client", shared_client._client)
+        monkeypatch.setattr(shared_client, "_users_cache", {})
+        monkeypatch.setattr(
+            shared_client, "_request_times", deque(maxlen=GongClient.RATE_LIMIT_REQUESTS_PER_SECOND)
+        )
+        return shared_client
 
     def test_init(self, client: GongClient) -> None:
         """Test client initialization."""
         assert client.base_url == "https://api.gong.io"
         assert isinstance(client.auth, httpx.BasicAuth)
+        assert isinstance(client._client, httpx.Client)
 
-    @patch("gong_to_github.gong_client.httpx.Client")
-    def test_request_success(
-        self, mock_client_class: MagicMock, client: GongClient
-    ) -> None:
-        """Test successful API request."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"data": "test"}
+    @pytest.fixture
+    def mock_http(self, client: GongClient) -> MagicMock:
+        """Replace the pooled HTTP client with a mock; tests set its responses."""
+        client._client = MagicMock(spec=httpx.Client)
+        return client._client
+
+    @pytest.fixture
+    def stub_request(self, monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+        """Replace the retrying request wrapper; tests set the parsed responses."""
+        stub = MagicMock()
+        monkeypatch.setattr(GongClient, "_request", stub)
+        return stub
+
+    def test_request_reuses_client(self, client: GongClient, mock_http: MagicMock) -> None:
+        """Test that requests share one pooled HTTP client."""
+        mock_http.request.return_value = httpx.Response(200, content=b"{}")
+
+        client._request("GET", "/a")
+        client._request("GET", "/b")
+
+        assert mock_http.request.call_count == 2
 
-        mock_client = MagicMock()
-        mock_client.request.return_value = mock_response
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
-        mock_client_class.return_value = mock_client
+    def test_context_manager_closes_client(self) -> None:
+        """Test that leaving the context closes the connection pool."""
+        with GongClient("key", "secret") as client:
+            assert not client._client.is_closed
+
+        assert client._client.is_closed
+
+    def test_request_success(self, client: GongClient, mock_http: MagicMock) -> None:
+        """Test successful API request."""
+        mock_http.request.return_value = httpx.Response(200, json={"data": "test"})
 
         result = client._request("GET", "/test")
         assert result == {"data": "test"}
 
-    @patch("gong_to_github.gong_client.httpx.Client")
-    def test_request_rate_limited(
-        self, mock_client_class: MagicMock, client: GongClient
-    ) -> None:
+    def test_request_rate_limited(self, client: GongClient, mock_http: MagicMock) -> None:
         """Test rate limit handling."""
-        mock_response = MagicMock()
-        mock_response.status_code = 429
-        mock_response.headers = {"Retry-After": "30"}
-
-        mock_client = MagicMock()
-        mock_client.request.return_value = mock_response
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
-        mock_client_class.return_value = mock_client
+        mock_http.request.return_value = httpx.Response(429, headers={"Retry-After": "30"})
 
         with pytest.raises(GongRateLimitError) as exc_info:
-            # Disable retry for test
-            client._request.__wrapped__(client, "GET", "/test")
+            client._send("GET", "/test")
 
         assert exc_info.value.retry_after == 30
 
-    @patch("gong_to_github.gong_client.httpx.Client")
-    def test_request_api_error(
-        self, mock_client_class: MagicMock, client: GongClient
-    ) -> None:
+    def test_request_api_error(self, client: GongClient, mock_http: MagicMock) -> None:
         """Test API error handling."""
-        mock_response = MagicMock()
-        mock_response.status_code = 400
-        mock_response.text = "Bad Request"
-
-        mock_client = MagicMock()
-        mock_client.request.return_value = mock_response
-        mock_client.__enter__ = MagicMock(return_value=mock_client)
-        mock_client.__exit__ = MagicMock(return_value=False)
-        mock_client_class.return_value = mock_client
+        mock_http.request.return_value = httpx.Response(400, text="Bad Request")
 
         with pytest.raises(GongAPIError) as exc_info:
-            client._request.__wrapped__(client, "GET", "/test")
+            client._send("GET", "/test")
 
         assert "400" in str(exc_info.value)
         assert "Bad Request" in str(exc_info.value)
 
-    @patch.object(GongClient, "_request")
+    def test_paginate_get_follows_cursor(
+        self, stub_request: MagicMock, client: GongClient
+    ) -> None:
+        """Test GET pagination passes the cursor and yields every page."""
+        stub_request.side_effect = [
+            {"records": {"cursor": "page-2"}, "calls": [{"id": "1"}, {"id": "2"}]},
+            {"records": {}, "calls": [{"id": "3"}]},
+        ]
+
+        items = list(client._paginate_get("/calls", params={"a": "b"}, data_key="calls"))
+
+        assert [i["id"] for i in items] == ["1", "2", "3"]
+        assert stub_request.call_count == 2
+        assert stub_request.call_args_list[1].kwargs["params"] == {"a": "b", "cursor": "page-2"}
+
+    def test_paginate_post_follows_top_level_cursor(
+        self, stub_request: MagicMock, client: GongClient
+    ) -> None:
+        """Test POST pagination sends the cursor in the body."""
+        stub_request.side_effect = [
+            {"cursor": "next", "records": [1]},
+            {"records": [2]},
+        ]
+
+        items = list(client._paginate_post("/things", json_body={"filter": {}}))
+
+        assert items == [1, 2]
+        assert stub_request.call_args_list[1].kwargs["json"] == {"filter": {}, "cursor": "next"}
+
     def test_get_users(
-        self, mock_request: MagicMock, client: GongClient, sample_gong_api_users_response: dict
+        self, stub_request: MagicMock, client: GongClient, sample_gong_api_users_response: dict
     ) -> None:
         """Test getting users."""
-        mock_request.return_value = sample_gong_api_users_response
+        stub_request.return_value = sample_gong_api_users_response
 
         users = client.get_users()
 
@@ -110,12 +153,11 @@ class TestGongClient:
         assert users[0].id == "user-1"
         assert users[0].full_name == "John Doe"
 
-    @patch.object(GongClient, "_request")
     def test_get_users_caches_results(
-        self, mock_request: MagicMock, client: GongClient, sample_gong_api_users_response: dict
+        self, stub_request: MagicMock, client: GongClient, sample_gong_api_users_response: dict
     ) -> None:
         """Test that users are cached."""
-        mock_request.return_value = sample_gong_api_users_response
+        stub_request.return_value = sample_gong_api_users_response
 
         # First call
         client.get_users()
@@ -123,35 +165,33 @@ class TestGongClient:
         client.get_users()
 
         # Should only call API once
-        assert mock_request.call_count == 1
+        assert stub_request.call_count == 1
 
-    @patch.object(GongClient, "_request")
     def test_get_user_by_id(
-        self, mock_request: MagicMock, client: GongClient, sample_gong_api_users_response: dict
+        self, stub_request: MagicMock, client: GongClient, sample_gong_api_users_response: dict
     ) -> None:
         """Test getting user by ID."""
-        mock_request.return_value = sample_gong_api_users_response
+        stub_request.return_value = sample_gong_api_users_response
 
         user = client.get_user_by_id("user-1")
         assert user is not None
         assert user.id == "user-1"
 
-    @patch.object(GongClient, "_request")
     def test_get_user_by_id_not_found(
-        self, mock_request: MagicMock, client: GongClient, sample_gong_api_users_response: dict
+        self, stub_request: MagicMock, client: GongClient, sample_gong_api_users_response: dict
     ) -> None:
         """Test getting nonexistent user."""
-        mock_request.return_value = sample_gong_api_users_response
+        stub_request.return_value = sample_gong_api_users_response
 
         user = client.get_user_by_id("nonexistent")
         assert user is None
 
-    @patch.object(GongClient, "_paginate_get")
+    @patch.object(GongClient, "_paginate_pages")
     def test_list_calls(
-        self, mock_paginate_get: MagicMock, client: GongClient
+        self, mock_paginate_pages: MagicMock, client: GongClient
     ) -> None:
         """Test listing calls."""
-        mock_paginate_get.return_value = iter([
+        mock_paginate_pages.return_value = iter([{"calls": [
             {
                 "id": "call-1",
                 "title": "Test Call",
@@ -162,7 +202,7 @@ class TestGongClient:
                 "title": "Internal Call",
                 "scope": "Internal",
             },
-        ])
+        ]}])
 
         calls = list(client.list_calls(scope="External"))
 
@@ -170,26 +210,26 @@ class TestGongClient:
         assert len(calls) == 1
         assert calls[0].id == "call-1"
 
-    @patch.object(GongClient, "_paginate_get")
+    @patch.object(GongClient, "_paginate_pages")
     def test_list_calls_no_scope_filter(
-        self, mock_paginate_get: MagicMock, client: GongClient
+        self, mock_paginate_pages: MagicMock, client: GongClient
     ) -> None:
         """Test listing calls without scope filter."""
-        mock_paginate_get.return_value = iter([
-            {"id": "call-1", "scope": "External"},
-            {"id": "call-2", "scope": "Internal"},
+        mock_paginate_pages.return_value = iter([
+            {"calls": [{"id": "call-1", "scope": "External"}]},
+            {"calls": [{"id": "call-2", "scope": "Internal"}]},
         ])
 
         calls = list(client.list_calls(scope=None))
 
         assert len(calls) == 2
+        assert all(isinstance(c, CallMetadata) for c in calls)
 
-    @patch.object(GongClient, "_request")
     def test_get_calls_extensive(
-        self, mock_request: MagicMock, client: GongClient, sample_gong_api_extensive_response: dict
+        self, stub_request: MagicMock, client: GongClient, sample_gong_api_extensive_response: dict
     ) -> None:
         """Test getting extensive call data."""
-        mock_request.return_value = sample_gong_api_extensive_response
+        stub_request.return_value = sample_gong_api_extensive_response
 
         result = client.get_calls_extensive(["call-123"])
 
@@ -197,89 +237,178 @@ class TestGongClient:
         assert "parties" in result["call-123"]
         assert len(result["call-123"]["parties"]) == 2
 
-    @patch.object(GongClient, "_request")
     def test_get_calls_extensive_empty_list(
-        self, mock_request: MagicMock, client: GongClient
+        self, stub_request: MagicMock, client: GongClient
     ) -> None:
         """Test getting extensive data with empty list."""
         result = client.get_calls_extensive([])
 
         assert result == {}
-        mock_request.assert_not_called()
+        stub_request.assert_not_called()
 
-    @patch.object(GongClient, "_request")
+    @pytest.mark.parametrize(
+        ("n", "expected_requests"),
+        [(0, 0), (100, 1), (101, 2), (150, 2), (250, 3)],
+    )
     def test_get_calls_extensive_batching(
-        self, mock_request: MagicMock, client: GongClient
+        self, stub_request: MagicMock, client: GongClient, n: int, expected_requests: int
     ) -> None:
         """Test that calls are batched in groups of 100."""
-        # Create 150 call IDs
-        call_ids = [f"call-{i}" for i in range(150)]
+        stub_request.return_value = {"calls": []}
+
+        # Only the number of IDs matters for chunking
+        client.get_calls_extensive(["call"] * n)
+
+        assert stub_request.call_count == expected_requests
 
-        mock_request.return_value = {"calls": []}
+    def test_get_transcripts_batching(
+        self, stub_request: MagicMock, client: GongClient
+    ) -> None:
+        """Test that transcript chunks are all requested and merged."""
+        stub_request.side_effect = lambda method, endpoint, json: {
+            "callTranscripts": [
+                {"callId": call_id, "transcript": []} for call_id in json["filter"]["callIds"]
+            ]
+        }
+        call_ids = [f"call-{i}" for i in range(250)]
 
-        client.get_calls_extensive(call_ids)
+        result = client.get_transcripts(call_ids)
 
-        # Should make 2 requests (100 + 50)
-        assert mock_request.call_count == 2
+        assert stub_request.call_count == 3
+        assert sorted(result) == sorted(call_ids)
 
-    @patch.object(GongClient, "_request")
     def test_get_transcripts(
-        self, mock_request: MagicMock, client: GongClient, sample_gong_api_transcript_response: dict
+        self, stub_request: MagicMock, client: GongClient, sample_gong_api_transcript_response: dict
     ) -> None:
         """Test getting transcripts."""
-        mock_request.return_value = sample_gong_api_transcript_response
+        stub_request.return_value = sample_gong_api_transcript_response
 
         result = client.get_transcripts(["call-123"])
 
         assert "call-123" in result
         assert len(result["call-123"].transcript) == 2
 
-    @patch.object(GongClient, "_request")
+    def test_get_transcripts_skips_missing_call_id(
+        self, stub_request: MagicMock, client: GongClient
+    ) -> None:
+        """Test transcripts without a call ID are ignored."""
+        stub_request.return_value = {
+            "callTranscripts": [
+                {"callId": "call-1", "transcript": []},
+                {"transcript": []},
+            ]
+        }
+
+        result = client.get_transcripts(["call-1", "call-2"])
+
+        assert list(result) == ["call-1"]
+
     def test_get_transcripts_empty_list(
-        self, mock_request: MagicMock, client: GongClient
+        self, stub_request: MagicMock, client: GongClient
     ) -> None:
         """Test getting transcripts with empty list."""
         result = client.get_transcripts([])
 
         assert result == {}
-        mock_request.assert_not_called()
-
+        stub_request.assert_not_called()
 
-class TestGongClientThrottling:
-    """Tests for rate limit throttling."""
-
-    @patch("gong_to_github.gong_client.time.sleep")
-    @patch("gong_to_github.gong_client.time.time")
-    def test_throttle_waits_when_needed(
-        self, mock_time: MagicMock, mock_sleep: MagicMock
+    @patch.object(GongClient, "_process_call_batch")
+    @patch.object(GongClient, "list_calls")
+    def test_get_full_calls_skip_ids(
+        self, mock_list_calls: MagicMock, mock_process: MagicMock, client: GongClient
     ) -> None:
-        """Test that throttle waits when requests are too fast."""
-        client = GongClient("key", "secret")
-
-        # Simulate time: first call at 0, second call at 0.1 (too fast)
-        # MIN_REQUEST_INTERVAL = 1/3 = 0.333... seconds
-        mock_time.side_effect = [0.1, 0.5]  # current_time, after sleep
+        """Test skipped calls are not fetched."""
+        mock_list_calls.return_value = iter(
+            [CallMetadata(id="call-1"), CallMetadata(id="call-2"), CallMetadata(id="call-3")]
+        )
+        mock_process.return_value = iter([])
+
+        list(client.get_full_calls(skip_ids={"call-2"}.__contains__))
+
+        batch = mock_process.call_args[0][0]
+        assert [call_meta.id for call_meta in batch] == ["call-1", "call-3"]
+
+    @patch.object(GongClient, "get_transcripts")
+    @patch.object(GongClient, "get_calls_extensive")
+    def test_process_call_batch(
+        self,
+        mock_extensive: MagicMock,
+        mock_transcripts: MagicMock,
+        client: GongClient,
+        sample_gong_api_extensive_response: dict,
+        sample_gong_api_transcript_response: dict,
+    ) -> None:
+        """Test that a batch combines extensive data and transcripts."""
+        mock_extensive.return_value = {
+            c["metaData"]["id"]: c for c in sample_gong_api_extensive_response["calls"]
+        }
+        mock_transcripts.return_value = {
+            t["callId"]: CallTranscript.model_validate(t)
+            for t in sample_gong_api_transcript_response["callTranscripts"]
+        }
+
+        batch = [
+            CallMetadata(id="call-123", title="Listed Title"),
+            CallMetadata(id="call-missing"),
+        ]
+        calls = list(client._process_call_batch(batch))
 
-        client._last_request_time = 0.0
-        client._throttle()
+        assert len(calls) == 1
+        assert calls[0].metadata is batch[0]
+        assert len(calls[0].parties) == 2
+        assert len(calls[0].transcript) == 2
+        mock_extensive.assert_called_once_with(["call-123", "call-missing"])
+        mock_transcripts.assert_called_once_with(["call-123", "call-missing"])
 
-        # Should have slept for ~0.233 seconds (0.333 - 0.1)
-        mock_sleep.assert_called_once()
-        sleep_time = mock_sleep.call_args[0][0]
-        assert 0.2 < sleep_time < 0.35
 
-    @patch("gong_to_github.gong_client.time.sleep")
-    @patch("gong_to_github.gong_client.time.time")
-    def test_throttle_no_wait_when_slow(
-        self, mock_time: MagicMock, mock_sleep: MagicMock
-    ) -> None:
-        """Test that throttle doesn't wait when requests are slow enough."""
-        client = GongClient("key", "secret")
+class TestGongClientThrottling:
+    """Tests for rate limit throttling."""
 
-        # Simulate time: enough time has passed
-        mock_time.return_value = 1.0
+    def test_throttle_waits_when_needed(self) -> None:
+        """Test that throttle waits until the oldest request in the window is a second old."""
+        sleeps: list[float] = []
+        with GongClient("key", "secret", clock=lambda: 0.1, sleep=sleeps.append) as client:
+            client._request_times.extend([0.0, 0.05, 0.1])
+            client._throttle()
 
-        client._last_request_time = 0.0
-        client._throttle()
+            assert sleeps == [pytest.approx(0.9)]
 
-        mock_sleep.assert_not_called()
+    def test_throttle_no_wait_when_slow(self) -> None:
+        """Test that throttle doesn't wait when requests are slow enough."""
+        sleeps: list[float] = []
+        with GongClient("key", "secret", clock=lambda: 1.0, sleep=sleeps.append) as client:
+            client._request_times.extend([0.0, 0.5, 0.9])
+            client._throttle()
+
+            assert sleeps == []
+
+    def test_throttle_allows_burst(self) -> None:
+        """Test that a burst up to the per-second budget goes through before waiting."""
+        sleeps: list[float] = []
+        with GongClient("key", "secret", clock=lambda: 0.0, sleep=sleeps.append) as client:
+            for _ in range(GongClient.RATE_LIMIT_REQUESTS_PER_SECOND):
+                client._throttle()
+            assert sleeps == []
+
+            client._throttle()
+            assert sleeps == [pytest.approx(1.0)]
+
+    def test_throttle_never_exceeds_rate(self) -> None:
+        """Test no one-second window ever holds more requests than the rate limit."""
+        now = 0.0
+
+        def sleep(seconds: float) -> None:
+            nonlocal now
+            now += seconds
+
+        with GongClient("key", "secret", clock=lambda: now, sleep=sleep) as client:
+            starts = []
+            for _ in range(20):
+                client._throttle()
+                starts.append(now)
+                now += 0.05
+
+        rate = GongClient.RATE_LIMIT_REQUESTS_PER_SECOND
+        # Allow for float rounding in the simulated clock
+        gaps = [later - earlier for earlier, later in zip(starts, starts[rate:])]
+        assert min(gaps) >= 1.0 - 1e-9
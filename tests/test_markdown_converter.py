@@ -1,11 +1,15 @@
 """Tests for markdown converter."""
 
+import re
 from datetime import datetime
 
 import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
 
 from gong_to_github.markdown_converter import (
     call_to_markdown,
+    client_index_entry,
     format_duration,
     format_participant,
     format_timestamp,
@@ -13,81 +17,95 @@ from gong_to_github.markdown_converter import (
     generate_client_index,
     generate_filename,
     get_speaker_name,
+    parse_client_index_rows,
+    render_call,
     slugify,
 )
-from gong_to_github.models import Affiliation, Call, CallMetadata, Participant
+from gong_to_github.models import (
+    Affiliation,
+    Call,
+    CallMetadata,
+    ClientIndexEntry,
+    Participant,
+    Sentence,
+    TranscriptSegment,
+)
+
+# Both sample dates in newest-first order, matched in a single pass
+_NEWEST_FIRST = re.compile(r"2025-01-10.*?2025-01-04", re.DOTALL)
 
 
 class TestSlugify:
     """Tests for slugify function."""
 
-    def test_simple_text(self) -> None:
-        """Test slugifying simple text."""
-        assert slugify("Hello World") == "hello-world"
-
-    def test_special_characters(self) -> None:
-        """Test slugifying text with special characters."""
-        assert slugify("Acme Corp - Discovery Call!") == "acme-corp-discovery-call"
-
-    def test_multiple_spaces(self) -> None:
-        """Test slugifying text with multiple spaces."""
-        assert slugify("Hello    World") == "hello-world"
-
-    def test_leading_trailing_dashes(self) -> None:
-        """Test slugifying removes leading/trailing dashes."""
-        assert slugify("--Hello World--") == "hello-world"
-
-    def test_unicode_characters(self) -> None:
-        """Test slugifying text with unicode (preserves accented chars)."""
-        assert slugify("Café Company") == "café-company"
-
-    def test_empty_string(self) -> None:
-        """Test slugifying empty string."""
-        assert slugify("") == ""
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            ("Hello World", "hello-world"),
+            ("Acme Corp - Discovery Call!", "acme-corp-discovery-call"),
+            ("Hello    World", "hello-world"),
+            ("--Hello World--", "hello-world"),
+            ("Café Company", "café-company"),  # accented chars are preserved
+            ("", ""),
+        ],
+        ids=["simple", "special-chars", "multiple-spaces", "edge-dashes", "unicode", "empty"],
+    )
+    def test_slugify(self, text: str, expected: str) -> None:
+        """Test slugifying text."""
+        assert slugify(text) == expected
+
+    @settings(max_examples=50, deadline=None)
+    @given(st.text(max_size=64))
+    def test_slugify_invariants(self, text: str) -> None:
+        """Test slugs never have edge or repeated dashes, or whitespace, and are stable."""
+        slug = slugify(text)
+        assert not slug.startswith("-") and not slug.endswith("-")
+        assert "--" not in slug
+        assert not re.search(r"\s", slug)
+        assert slugify(slug) == slug
+
+    def test_ascii_matches_regex(self) -> None:
+        """Test the ASCII fast path strips the same characters as the regex."""
+        text = "".join(map(chr, range(128)))
+        expected = re.sub(r"[-\s]+", "-", re.sub(r"[^\w\s-]", "", text.lower())).strip("-")
+        assert slugify(text) == expected
 
 
 class TestFormatTimestamp:
     """Tests for format_timestamp function."""
 
-    def test_zero_ms(self) -> None:
-        """Test formatting zero milliseconds."""
-        assert format_timestamp(0) == "[00:00]"
-
-    def test_seconds_only(self) -> None:
-        """Test formatting seconds only."""
-        assert format_timestamp(30000) == "[00:30]"
-
-    def test_minutes_and_seconds(self) -> None:
-        """Test formatting minutes and seconds."""
-        assert format_timestamp(90000) == "[01:30]"
-
-    def test_hours(self) -> None:
-        """Test formatting with hours."""
-        assert format_timestamp(3661000) == "[01:01:01]"
-
-    def test_large_value(self) -> None:
-        """Test formatting large value."""
-        assert format_timestamp(7200000) == "[02:00:00]"
+    @pytest.mark.parametrize(
+        ("ms", "expected"),
+        [
+            (0, "[00:00]"),
+            (30000, "[00:30]"),
+            (90000, "[01:30]"),
+            (3661000, "[01:01:01]"),
+            (7200000, "[02:00:00]"),
+        ],
+        ids=["zero", "seconds", "minutes", "hours", "large"],
+    )
+    def test_format_timestamp(self, ms: int, expected: str) -> None:
+        """Test formatting milliseconds as a timestamp."""
+        assert format_timestamp(ms) == expected
 
 
 class TestFormatDuration:
     """Tests for format_duration function."""
 
-    def test_minutes_only(self) -> None:
-        """Test formatting duration with minutes only."""
-        assert format_duration(1800) == "30 min"
-
-    def test_hours_and_minutes(self) -> None:
-        """Test formatting duration with hours and minutes."""
-        assert format_duration(5400) == "1h 30min"
-
-    def test_exact_hour(self) -> None:
-        """Test formatting exact hour."""
-        assert format_duration(3600) == "1h 0min"
-
-    def test_zero(self) -> None:
-        """Test formatting zero duration."""
-        assert format_duration(0) == "0 min"
+    @pytest.mark.parametrize(
+        ("seconds", "expected"),
+        [
+            (1800, "30 min"),
+            (5400, "1h 30min"),
+            (3600, "1h 0min"),
+            (0, "0 min"),
+        ],
+        ids=["minutes", "hours-and-minutes", "exact-hour", "zero"],
+    )
+    def test_format_duration(self, seconds: int, expected: str) -> None:
+        """Test formatting a duration."""
+        assert format_duration(seconds) == expected
 
 
 class TestGetSpeakerName:
@@ -115,6 +133,17 @@ class TestGetSpeakerName:
         assert name == "Jane Smith"
         assert affiliation == Affiliation.EXTERNAL
 
+    def test_speaker_from_mapping(self, parties_by_speaker: dict[str, Participant]) -> None:
+        """Test resolving speakers from a speaker ID index."""
+        assert get_speaker_name("speaker-2", parties_by_speaker) == (
+            "Jane Smith",
+            Affiliation.EXTERNAL,
+        )
+        assert get_speaker_name("unknown-speaker-id", parties_by_speaker) == (
+            "Speaker unknown-",
+            None,
+        )
+
     def test_unknown_speaker(self) -> None:
         """Test unknown speaker returns truncated ID."""
         name, affiliation = get_speaker_name("unknown-speaker-id", [])
@@ -174,29 +203,28 @@ class TestCallToMarkdown:
         """Test converting full call to markdown."""
         md = call_to_markdown(sample_call)
 
-        # Check title
-        assert "# Acme Corp - Discovery Call" in md
-
-        # Check metadata
-        assert "**Date:** 2025-01-04 14:03" in md
-        assert "**Duration:** 30 min" in md
-
-        # Check participants
-        assert "**Participants:**" in md
-        assert "John Doe (Internal) - Account Executive" in md
-        assert "Jane Smith (External) - VP of Sales" in md
-
-        # Check system info
-        assert "**System:** Zoom" in md
-        assert "**Type:** External" in md
-
-        # Check Gong URL
-        assert "[View in Gong](https://app.gong.io/call?id=call-123)" in md
-
-        # Check transcript
-        assert "## Transcript" in md
-        assert "Hi Jane, thanks for joining today!" in md
-        assert "(Client)" in md  # External speaker indicator
+        expected = [
+            # Title
+            "# Acme Corp - Discovery Call",
+            # Metadata
+            "**Date:** 2025-01-04 14:03",
+            "**Duration:** 30 min",
+            # Participants
+            "**Participants:**",
+            "John Doe (Internal) - Account Executive",
+            "Jane Smith (External) - VP of Sales",
+            # System info
+            "**System:** Zoom",
+            "**Type:** External",
+            # Gong URL
+            "[View in Gong](https://app.gong.io/call?id=call-123)",
+            # Transcript
+            "## Transcript",
+            "Hi Jane, thanks for joining today!",
+            "(Client)",  # External speaker indicator
+        ]
+        missing = [e for e in expected if e not in md]
+        assert not missing, missing
 
     def test_minimal_call(self, sample_call_minimal: Call) -> None:
         """Test converting minimal call to markdown."""
@@ -204,6 +232,17 @@ class TestCallToMarkdown:
         assert "# Untitled Call" in md
         assert "## Transcript" not in md  # No transcript
 
+    def test_frontmatter_fields(self) -> None:
+        """Test frontmatter quotes titles and omits empty fields."""
+        call = Call(
+            metaData=CallMetadata(id="call-1", title='Say "hi"', duration=0),
+            parties=[],
+            transcript=[],
+            context=[],
+        )
+        md = call_to_markdown(call)
+        assert md.startswith('---\ngong_id: call-1\ntitle: "Say \\"hi\\""\n---\n')
+
     def test_call_without_transcript(
         self,
         sample_call_metadata: CallMetadata,
@@ -219,6 +258,42 @@ class TestCallToMarkdown:
         md = call_to_markdown(call)
         assert "## Transcript" not in md
 
+    def test_transcript_unknown_speaker(
+        self,
+        sample_call_metadata: CallMetadata,
+        sample_internal_participant: Participant,
+    ) -> None:
+        """Test transcript speakers missing from parties get a fallback name."""
+        call = Call(
+            metaData=sample_call_metadata,
+            parties=[sample_internal_participant],
+            transcript=[
+                TranscriptSegment(
+                    speakerId="abcdef123456",
+                    sentences=[Sentence(start=0, end=1000, text="Hello")],
+                ),
+                TranscriptSegment(
+                    speakerId="speaker-1",
+                    sentences=[Sentence(start=1000, end=2000, text="Hi")],
+                ),
+            ],
+            context=[],
+        )
+        md = call_to_markdown(call)
+        assert "**[00:00] Speaker abcdef12:**" in md
+        assert "**[00:01] John Doe:**" in md
+
+
+class TestRenderCall:
+    """Tests for render_call function."""
+
+    def test_render_call(self, sample_call: Call) -> None:
+        """Test rendering a call to its filename and markdown."""
+        assert render_call(sample_call) == (
+            generate_filename(sample_call),
+            call_to_markdown(sample_call),
+        )
+
 
 class TestGenerateFilename:
     """Tests for generate_filename function."""
@@ -229,10 +304,9 @@ class TestGenerateFilename:
         assert filename == "2025-01-04-acme-corp-discovery-call.md"
 
     def test_filename_without_date(self, sample_call_minimal: Call) -> None:
-        """Test generating filename without date."""
+        """Test undated calls get a fixed prefix and fall back to their ID as title."""
         filename = generate_filename(sample_call_minimal)
-        assert filename.startswith("unknown-date-")
-        assert filename.endswith(".md")
+        assert filename == "unknown-date-call-minimal.md"
 
     def test_filename_long_title_truncated(self) -> None:
         """Test that long titles are truncated."""
@@ -269,13 +343,32 @@ class TestGenerateClientFolderName:
         folder = generate_client_folder_name(sample_call_minimal)
         assert folder == "unknown-client"
 
+    def test_folder_name_is_lowercase(self, sample_call_metadata: CallMetadata) -> None:
+        """Test folder names are lowercase so filters can skip case folding."""
+        call = Call(
+            metaData=sample_call_metadata,
+            context=[
+                {
+                    "system": "Salesforce",
+                    "objects": [
+                        {
+                            "objectType": "Account",
+                            "fields": [{"name": "Name", "value": "ACME Big-Corp ÉTÉ"}],
+                        }
+                    ],
+                }
+            ],
+        )
+        folder = generate_client_folder_name(call)
+        assert folder == folder.lower() == "acme-big-corp-été"
+
 
 class TestGenerateClientIndex:
     """Tests for generate_client_index function."""
 
     def test_index_content(self, sample_call: Call) -> None:
         """Test generating client index."""
-        index = generate_client_index("Acme Corporation", [sample_call])
+        index = generate_client_index("Acme Corporation", [client_index_entry(sample_call)])
 
         assert "# Acme Corporation - Call History" in index
         assert "Total calls: 1" in index
@@ -284,6 +377,18 @@ class TestGenerateClientIndex:
         assert "2025-01-04" in index
         assert "Acme Corp - Discovery Call" in index
         assert "30 min" in index
+        assert "(./2025-01-04-acme-corp-discovery-call.md)" in index
+        assert "| 2 |" in index
+
+    def test_client_index_entry(self, sample_call: Call) -> None:
+        """Test summarizing a call for the index."""
+        entry = client_index_entry(sample_call)
+
+        assert entry.filename == "2025-01-04-acme-corp-discovery-call.md"
+        assert entry.title == "Acme Corp - Discovery Call"
+        assert entry.started == datetime(2025, 1, 4, 14, 3, 0)
+        assert entry.duration == 1800
+        assert entry.participant_count == 2
 
     def test_index_multiple_calls(self, sample_call: Call) -> None:
         """Test index with multiple calls."""
@@ -300,7 +405,55 @@ class TestGenerateClientIndex:
             context=[],
         )
 
-        index = generate_client_index("Acme", [sample_call, call2])
+        index = generate_client_index(
+            "Acme", [client_index_entry(sample_call), client_index_entry(call2)]
+        )
         assert "Total calls: 2" in index
-        # Newest first
-        assert index.index("2025-01-10") < index.index("2025-01-04")
+        assert _NEWEST_FIRST.search(index), "expected newest-first ordering"
+
+    def test_index_undated_calls_last(self) -> None:
+        """Test calls without a date are listed after dated ones, in input order."""
+        entries = [
+            ClientIndexEntry(filename="b.md", title="Undated B"),
+            ClientIndexEntry(filename="old.md", started=datetime(2025, 1, 1)),
+            ClientIndexEntry(filename="a.md", title="Undated A"),
+            ClientIndexEntry(filename="new.md", started=datetime(2025, 2, 1)),
+        ]
+
+        index = generate_client_index("Acme", entries)
+        positions = [index.index(f"(./{name})") for name in ("new.md", "old.md", "b.md", "a.md")]
+        assert positions == sorted(positions)
+
+    def test_parse_index_rows(self) -> None:
+        """Test index rows are keyed by the transcript file they link to."""
+        entries = [
+            ClientIndexEntry(filename="call-1.md", title="See [notes](./x.md)"),
+            ClientIndexEntry(filename="call-2.md", started=datetime(2025, 1, 1)),
+        ]
+
+        rows = parse_client_index_rows(generate_client_index("Acme", entries))
+
+        assert sorted(rows) == ["call-1.md", "call-2.md"]
+        assert rows["call-2.md"].startswith("| 2025-01-01 |")
+
+    def test_index_keeps_existing_rows(self) -> None:
+        """Test rows of earlier runs are kept, re-sorted, and replaced by new entries."""
+        old = [
+            ClientIndexEntry(filename="old.md", title="Old", started=datetime(2025, 1, 1)),
+            ClientIndexEntry(filename="same.md", title="Before", started=datetime(2025, 1, 5)),
+            ClientIndexEntry(filename="undated.md", title="Undated"),
+        ]
+        existing_rows = parse_client_index_rows(generate_client_index("Acme", old))
+        new = [
+            ClientIndexEntry(filename="new.md", title="New", started=datetime(2025, 1, 3)),
+            ClientIndexEntry(filename="same.md", title="After", started=datetime(2025, 1, 5)),
+        ]
+
+        index = generate_client_index("Acme", new, existing_rows)
+
+        assert "Total calls: 4" in index
+        assert "Before" not in index
+        names = ("same.md", "new.md", "old.md", "undated.md")
+        positions = [index.index(f"(./{name})") for name in names]
+        assert positions == sorted(positions)
+
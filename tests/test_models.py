@@ -1,8 +1,10 @@
 """Tests for data models."""
 
 from datetime import datetime
+from typing import Any
 
 import pytest
+from pydantic import BaseModel, ValidationError
 
 from gong_to_github.models import (
     Affiliation,
@@ -12,75 +14,37 @@ from gong_to_github.models import (
     Sentence,
     TranscriptSegment,
     User,
+    client_name_from_domain,
 )
 from gong_to_github.state import SyncState
+from tests.helpers import build
 
 
 class TestUser:
     """Tests for User model."""
 
-    def test_full_name_with_both_names(self, sample_user: User) -> None:
-        """Test full_name property with first and last name."""
-        assert sample_user.full_name == "John Doe"
-
-    def test_full_name_with_first_name_only(self) -> None:
-        """Test full_name property with first name only."""
-        user = User(id="1", emailAddress="test@test.com", firstName="John")
-        assert user.full_name == "John"
-
-    def test_full_name_with_last_name_only(self) -> None:
-        """Test full_name property with last name only."""
-        user = User(id="1", emailAddress="test@test.com", lastName="Doe")
-        assert user.full_name == "Doe"
-
-    def test_full_name_fallback_to_email(self) -> None:
-        """Test full_name property falls back to email."""
-        user = User(id="1", emailAddress="test@test.com")
-        assert user.full_name == "test@test.com"
-
-    def test_user_from_api_response(self) -> None:
-        """Test creating User from API response format."""
-        data = {
-            "id": "123",
-            "emailAddress": "john@company.com",
-            "firstName": "John",
-            "lastName": "Doe",
-            "active": True,
-        }
-        user = User.model_validate(data)
-        assert user.id == "123"
-        assert user.email_address == "john@company.com"
-        assert user.first_name == "John"
-        assert user.last_name == "Doe"
-        assert user.active is True
-
-
-class TestParticipant:
-    """Tests for Participant model."""
-
-    def test_participant_from_api_response(self) -> None:
-        """Test creating Participant from API response format."""
-        data = {
-            "id": "party-1",
-            "emailAddress": "jane@acme.com",
-            "name": "Jane Smith",
-            "title": "VP Sales",
-            "speakerId": "speaker-2",
-            "affiliation": "External",
-        }
-        participant = Participant.model_validate(data)
-        assert participant.id == "party-1"
-        assert participant.email_address == "jane@acme.com"
-        assert participant.name == "Jane Smith"
-        assert participant.affiliation == Affiliation.EXTERNAL
-
-    def test_participant_minimal(self) -> None:
-        """Test creating Participant with minimal data."""
-        data = {"id": "party-1"}
-        participant = Participant.model_validate(data)
-        assert participant.id == "party-1"
-        assert participant.email_address is None
-        assert participant.name is None
+    @pytest.mark.parametrize(
+        ("first_name", "last_name", "expected"),
+        [
+            ("John", "Doe", "John Doe"),
+            ("John", None, "John"),
+            (None, "Doe", "Doe"),
+            (None, None, "test@test.com"),
+        ],
+        ids=["both-names", "first-name-only", "last-name-only", "email-fallback"],
+    )
+    def test_full_name(
+        self, first_name: str | None, last_name: str | None, expected: str
+    ) -> None:
+        """Test full_name joins the names present and falls back to the email."""
+        user = build(
+            User, id="1", email_address="test@test.com", first_name=first_name, last_name=last_name
+        )
+        assert user.full_name == expected
+
+    def test_full_name_cached(self, sample_user: User) -> None:
+        """Test full_name is computed once and then reused."""
+        assert sample_user.full_name is sample_user.full_name
 
 
 class TestCallMetadata:
@@ -94,55 +58,116 @@ class TestCallMetadata:
         assert sample_call_metadata.system == "Zoom"
         assert sample_call_metadata.scope == "External"
 
-    def test_call_metadata_minimal(self) -> None:
-        """Test CallMetadata with minimal data."""
-        data = {"id": "call-minimal"}
-        metadata = CallMetadata.model_validate(data)
-        assert metadata.id == "call-minimal"
-        assert metadata.title is None
-        assert metadata.duration is None
-
-
-class TestTranscript:
-    """Tests for transcript models."""
-
-    def test_sentence_from_api(self) -> None:
-        """Test Sentence model from API data."""
-        data = {"startMs": 1000, "endMs": 5000, "text": "Hello world"}
-        sentence = Sentence.model_validate(data)
-        assert sentence.start_ms == 1000
-        assert sentence.end_ms == 5000
-        assert sentence.text == "Hello world"
-
-    def test_transcript_segment_from_api(self) -> None:
-        """Test TranscriptSegment model from API data."""
-        data = {
-            "speakerId": "speaker-1",
-            "sentences": [
-                {"startMs": 0, "endMs": 1000, "text": "Hi"},
-                {"startMs": 1500, "endMs": 3000, "text": "How are you?"},
-            ],
-        }
-        segment = TranscriptSegment.model_validate(data)
-        assert segment.speaker_id == "speaker-1"
-        assert len(segment.sentences) == 2
-        assert segment.sentences[0].text == "Hi"
+
+class TestFromApiResponse:
+    """Tests for validating Gong API payloads into models."""
+
+    @pytest.mark.parametrize(
+        ("model", "data", "expected"),
+        [
+            (
+                User,
+                {
+                    "id": "123",
+                    "emailAddress": "john@company.com",
+                    "firstName": "John",
+                    "lastName": "Doe",
+                    "active": True,
+                },
+                {
+                    "id": "123",
+                    "email_address": "john@company.com",
+                    "first_name": "John",
+                    "last_name": "Doe",
+                    "active": True,
+                },
+            ),
+            (
+                Participant,
+                {
+                    "id": "party-1",
+                    "emailAddress": "jane@acme.com",
+                    "name": "Jane Smith",
+                    "title": "VP Sales",
+                    "speakerId": "speaker-2",
+                    "affiliation": "External",
+                },
+                {
+                    "id": "party-1",
+                    "email_address": "jane@acme.com",
+                    "name": "Jane Smith",
+                    "speaker_id": "speaker-2",
+                    "affiliation": Affiliation.EXTERNAL,
+                },
+            ),
+            (
+                Participant,
+                {"id": "party-1"},
+                {"id": "party-1", "email_address": None, "name": None},
+            ),
+            (
+                CallMetadata,
+                {"id": "call-minimal"},
+                {"id": "call-minimal", "title": None, "duration": None},
+            ),
+            (
+                Sentence,
+                {"startMs": 1000, "endMs": 5000, "text": "Hello world"},
+                {"start_ms": 1000, "end_ms": 5000, "text": "Hello world"},
+            ),
+            (
+                TranscriptSegment,
+                {
+                    "speakerId": "speaker-1",
+                    "sentences": [
+                        {"startMs": 0, "endMs": 1000, "text": "Hi"},
+                        {"startMs": 1500, "endMs": 3000, "text": "How are you?"},
+                    ],
+                },
+                {
+                    "speaker_id": "speaker-1",
+                    "sentences": [
+                        build(Sentence, start_ms=0, end_ms=1000, text="Hi"),
+                        build(Sentence, start_ms=1500, end_ms=3000, text="How are you?"),
+                    ],
+                },
+            ),
+        ],
+        ids=[
+            "user",
+            "participant",
+            "participant-minimal",
+            "call-metadata-minimal",
+            "sentence",
+            "transcript-segment",
+        ],
+    )
+    def test_model_validate(
+        self, model: type[BaseModel], data: dict[str, Any], expected: dict[str, Any]
+    ) -> None:
+        """Test API field aliases map to the model fields, with defaults for missing ones."""
+        instance = model.model_validate(data)
+        assert {field: getattr(instance, field) for field in expected} == expected
 
 
 class TestCall:
     """Tests for Call model."""
 
-    def test_client_name_from_salesforce(self, sample_call: Call) -> None:
-        """Test client_name extraction from Salesforce context."""
-        assert sample_call.client_name == "Acme Corporation"
-
-    def test_client_name_from_email_domain(self, sample_call_without_salesforce: Call) -> None:
-        """Test client_name extraction from email domain."""
-        assert sample_call_without_salesforce.client_name == "Acme"
-
-    def test_client_name_none_when_no_data(self, sample_call_minimal: Call) -> None:
-        """Test client_name returns None when no data available."""
-        assert sample_call_minimal.client_name is None
+    @pytest.mark.parametrize(
+        ("call_fixture", "expected"),
+        [
+            ("sample_call", "Acme Corporation"),
+            ("sample_call_without_salesforce", "Acme"),
+            ("sample_call_minimal", None),
+        ],
+        ids=["salesforce-account", "email-domain", "no-data"],
+    )
+    def test_client_name(
+        self, request: pytest.FixtureRequest, call_fixture: str, expected: str | None
+    ) -> None:
+        """Test client_name prefers the Salesforce account, then the external email domain."""
+        call: Call = request.getfixturevalue(call_fixture)
+        assert call.client_name == expected
 
     def test_external_participants(self, sample_call: Call) -> None:
         """Test external_participants property."""
@@ -158,6 +183,46 @@ class TestCall:
         assert internal[0].name == "John Doe"
         assert internal[0].affiliation == Affiliation.INTERNAL
 
+    def test_affiliation_is_its_api_string(self) -> None:
+        """Test affiliations compare and format as the raw Gong API strings."""
+        assert Affiliation.EXTERNAL == "External"
+        assert f"{Affiliation.INTERNAL}" == "Internal"
+        assert Affiliation("External") is Affiliation.EXTERNAL
+
+    def test_partition_parties(self, sample_call: Call) -> None:
+        """Test partition_parties matches the per-affiliation properties."""
+        internal, external = sample_call.partition_parties()
+        assert internal == sample_call.internal_participants
+        assert external == sample_call.external_participants
+
+    def test_partition_computed_once(self, sample_call: Call) -> None:
+        """Test the participant lists are partitioned once and then shared."""
+        assert sample_call.partition_parties() == (
+            sample_call.internal_participants,
+            sample_call.external_participants,
+        )
+        assert sample_call.external_participants is sample_call.partition_parties()[1]
+
+    def test_call_is_frozen(self, sample_call: Call) -> None:
+        """Test calls and their nested models reject attribute assignment."""
+        with pytest.raises(ValidationError):
+            sample_call.metadata.title = "Changed"
+        with pytest.raises(ValidationError):
+            sample_call.parties[0].name = "Changed"
+
+
+class TestClientNameFromDomain:
+    """Tests for client_name_from_domain function."""
+
+    @pytest.mark.parametrize(
+        ("domain", "expected"),
+        [("acme.com", "Acme"), ("big-corp.co.uk", "Big-Corp"), ("localhost", "Localhost")],
+        ids=["simple", "multi-part-tld", "no-dot"],
+    )
+    def test_client_name_from_domain(self, domain: str, expected: str) -> None:
+        """Test the first domain label is title-cased."""
+        assert client_name_from_domain(domain) == expected
+
 
 class TestSyncState:
     """Tests for SyncState model."""
@@ -173,7 +238,7 @@ class TestSyncState:
     def test_sync_state_json_serialization(self, sample_sync_state: SyncState) -> None:
         """Test sync state can be serialized to JSON."""
         json_data = sample_sync_state.model_dump(mode="json")
-        assert "last_sync_timestamp" in json_data
+        assert json_data["last_sync_epoch"] == int(datetime(2025, 1, 1).timestamp())
 
         # Verify it can be deserialized
         restored = SyncState.model_validate(json_data)
@@ -3,30 +3,41 @@
 import json
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
+from pyfakefs.fake_filesystem import FakeFilesystem
 
 from gong_to_github.state import (
     SyncState,
     load_state,
+    mark_seen,
     save_state,
     update_last_sync,
 )
 
 
+@pytest.fixture
+def state_dir(fs_module: FakeFilesystem, request: pytest.FixtureRequest) -> Path:
+    """Return an empty in-memory directory unique to the test, so state writes skip the disk."""
+    path = Path("/state") / request.node.name
+    path.mkdir(parents=True)
+    return path
+
+
 class TestLoadState:
     """Tests for load_state function."""
 
-    def test_load_nonexistent_file(self, tmp_path: Path) -> None:
+    def test_load_nonexistent_file(self, state_dir: Path) -> None:
         """Test loading from nonexistent file returns empty state."""
-        state_file = tmp_path / "nonexistent.json"
+        state_file = state_dir / "nonexistent.json"
         state = load_state(state_file)
 
         assert state.last_sync_timestamp is None
 
-    def test_load_valid_state(self, tmp_path: Path) -> None:
-        """Test loading valid state file."""
-        state_file = tmp_path / "state.json"
+    def test_load_valid_state(self, state_dir: Path) -> None:
+        """Test loading a state file with an ISO timestamp, as older versions wrote."""
+        state_file = state_dir / "state.json"
         state_file.write_text(
             json.dumps({"last_sync_timestamp": "2025-01-01T00:00:00"})
         )
@@ -34,17 +45,27 @@ class TestLoadState:
         state = load_state(state_file)
         assert state.last_sync_timestamp == datetime(2025, 1, 1, 0, 0, 0)
 
-    def test_load_corrupted_json(self, tmp_path: Path) -> None:
+    def test_load_epoch_state(self, state_dir: Path) -> None:
+        """Test loading a state file with an epoch timestamp."""
+        epoch = int(datetime(2025, 1, 1, 0, 0, 0).timestamp())
+        state_file = state_dir / "state.json"
+        state_file.write_text(json.dumps({"last_sync_epoch": epoch}))
+
+        state = load_state(state_file)
+        assert state.last_sync_epoch == epoch
+        assert state.last_sync_timestamp == datetime(2025, 1, 1, 0, 0, 0)
+
+    def test_load_corrupted_json(self, state_dir: Path) -> None:
         """Test loading corrupted JSON returns empty state."""
-        state_file = tmp_path / "corrupted.json"
+        state_file = state_dir / "corrupted.json"
         state_file.write_text("not valid json {{{")
 
         state = load_state(state_file)
         assert state.last_sync_timestamp is None
 
-    def test_load_invalid_schema(self, tmp_path: Path) -> None:
+    def test_load_invalid_schema(self, state_dir: Path) -> None:
         """Test loading invalid schema returns empty state."""
-        state_file = tmp_path / "invalid.json"
+        state_file = state_dir / "invalid.json"
         state_file.write_text(json.dumps({"unknown_field": "value"}))
 
         state = load_state(state_file)
@@ -55,27 +76,47 @@ class TestLoadState:
 class TestSaveState:
     """Tests for save_state function."""
 
-    def test_save_state(self, tmp_path: Path) -> None:
+    def test_save_state(self, state_dir: Path) -> None:
         """Test saving state to file."""
         state = SyncState(last_sync_timestamp=datetime(2025, 1, 1, 12, 0, 0))
-        state_file = tmp_path / "state.json"
+        state_file = state_dir / "state.json"
         save_state(state, state_file)
 
         assert state_file.exists()
         data = json.loads(state_file.read_text())
-        assert "last_sync_timestamp" in data
+        assert data["last_sync_epoch"] == int(datetime(2025, 1, 1, 12, 0, 0).timestamp())
 
-    def test_save_state_creates_directory(self, tmp_path: Path) -> None:
+    def test_save_state_creates_directory(self, state_dir: Path) -> None:
         """Test save_state creates parent directories."""
-        state_file = tmp_path / "subdir" / "nested" / "state.json"
+        state_file = state_dir / "subdir" / "nested" / "state.json"
         state = SyncState()
         save_state(state, state_file)
 
         assert state_file.exists()
 
-    def test_save_and_load_roundtrip(self, tmp_path: Path) -> None:
+    def test_save_state_replaces_atomically(self, state_dir: Path) -> None:
+        """Test saving over a state file leaves no temporary file behind."""
+        state_file = state_dir / "state.json"
+        save_state(SyncState(), state_file)
+        save_state(SyncState(seen_ids={"call-1"}), state_file)
+
+        assert [f.name for f in state_dir.iterdir()] == ["state.json"]
+        assert json.loads(state_file.read_text())["seen_ids"] == ["call-1"]
+
+    def test_save_state_existing_directory(self, state_dir: Path) -> None:
+        """Test saving into an existing directory does not try to create it."""
+        state_file = state_dir / "nested" / "state.json"
+        save_state(SyncState(), state_file)
+
+        with patch.object(Path, "mkdir") as mock_mkdir:
+            save_state(SyncState(), state_file)
+            save_state(SyncState(), state_dir / "other-state.json")
+
+        mock_mkdir.assert_not_called()
+
+    def test_save_and_load_roundtrip(self, state_dir: Path) -> None:
         """Test saving and loading preserves data."""
-        state_file = tmp_path / "state.json"
+        state_file = state_dir / "state.json"
         original = SyncState(last_sync_timestamp=datetime(2025, 1, 15, 10, 30, 0))
 
         save_state(original, state_file)
@@ -83,6 +124,14 @@ class TestSaveState:
 
         assert loaded.last_sync_timestamp == original.last_sync_timestamp
 
+    def test_seen_ids_roundtrip(self, state_dir: Path) -> None:
+        """Test seen call IDs survive a save and load."""
+        state_file = state_dir / "state.json"
+        save_state(SyncState(seen_ids={"call-2", "call-1"}), state_file)
+
+        assert json.loads(state_file.read_text())["seen_ids"] == ["call-1", "call-2"]
+        assert load_state(state_file).seen_ids == {"call-1", "call-2"}
+
 
 class TestUpdateLastSync:
     """Tests for update_last_sync function."""
@@ -91,15 +140,23 @@ class TestUpdateLastSync:
         """Test updating with specific timestamp."""
         state = SyncState()
         timestamp = datetime(2025, 6, 15, 12, 0, 0)
-        update_last_sync(state, timestamp)
-        assert state.last_sync_timestamp == timestamp
+        updated = update_last_sync(state, timestamp)
+        assert updated.last_sync_timestamp == timestamp
+        assert state.last_sync_timestamp is None
 
     def test_update_without_timestamp(self) -> None:
-        """Test updating without timestamp uses current time."""
-        state = SyncState()
-        before = datetime.now()
-        update_last_sync(state)
-        after = datetime.now()
+        """Test updating without timestamp uses the current time."""
+        now = datetime(2025, 6, 15, 12, 0, 0)
+        state = update_last_sync(SyncState(), clock=lambda: now)
+        assert state.last_sync_timestamp == now
+
+
+class TestMarkSeen:
+    """Tests for mark_seen function."""
 
-        assert state.last_sync_timestamp is not None
-        assert before <= state.last_sync_timestamp <= after
+    def test_mark_seen_adds_ids(self) -> None:
+        """Test call IDs are added to the seen set."""
+        state = SyncState(seen_ids={"call-1"})
+        updated = mark_seen(state, ["call-2", "call-1"])
+        assert updated.seen_ids == {"call-1", "call-2"}
+        assert state.seen_ids == {"call-1"}